@@ -0,0 +1,28 @@
+"""cover status_created index."""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7e5b21"
+down_revision: Union[str, Sequence[str], None] = "d0572b90cf54"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("index_transactions_status_created", table_name="transactions", if_exists=True)
+    op.create_index(
+        "index_transactions_status_created",
+        "transactions",
+        ["status", "created"],
+        postgresql_include=["amount", "currency"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("index_transactions_status_created", table_name="transactions", if_exists=True)
+    op.create_index("index_transactions_status_created", "transactions", ["status", "created"])
@@ -0,0 +1,25 @@
+"""drop redundant pk indexes."""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7f3b9c1e42"
+down_revision: Union[str, Sequence[str], None] = "c4a8e2f17d90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PK_INDEXED_TABLES = ("users", "user_balances", "transactions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in PK_INDEXED_TABLES:
+        op.drop_index(f"ix_{table}_id", table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in PK_INDEXED_TABLES:
+        op.create_index(f"ix_{table}_id", table, ["id"], if_not_exists=True)
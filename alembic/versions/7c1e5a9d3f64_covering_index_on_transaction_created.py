@@ -0,0 +1,35 @@
+"""covering index on transaction created."""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e5a9d3f64"
+down_revision: Union[str, Sequence[str], None] = "2a6f8d4c0b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "index_transactions_created_status",
+        "transactions",
+        ["created", "status"],
+        postgresql_include=["user_id", "amount", "currency"],
+        if_not_exists=True,
+    )
+    op.drop_index("index_transactions_created_brin", table_name="transactions", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "index_transactions_created_brin",
+        "transactions",
+        ["created"],
+        postgresql_using="brin",
+        if_not_exists=True,
+    )
+    op.drop_index("index_transactions_created_status", table_name="transactions", if_exists=True)
@@ -0,0 +1,30 @@
+"""store currency as varchar."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.models.enums import CurrencyEnumDB
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4d6f0a13"
+down_revision: Union[str, Sequence[str], None] = "3f1c9a7e5b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CURRENCY_TABLES = ("user_balances", "transactions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in CURRENCY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN currency TYPE VARCHAR(4) USING currency::text")
+    op.execute("DROP TYPE IF EXISTS currencyenumdb")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    sa.Enum(CurrencyEnumDB, name="currencyenumdb").create(op.get_bind(), checkfirst=True)
+    for table in CURRENCY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN currency TYPE currencyenumdb USING currency::currencyenumdb")
@@ -0,0 +1,32 @@
+"""store amounts as minor units."""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.db_models.types import AMOUNT_SCALE
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3b7c5a2d18"
+down_revision: Union[str, Sequence[str], None] = "5d7f3b9c1e42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AMOUNT_TABLES = ("user_balances", "transactions")
+MINOR_UNITS_PER_UNIT = 10**AMOUNT_SCALE
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in AMOUNT_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN amount TYPE BIGINT USING round(amount * {MINOR_UNITS_PER_UNIT})::bigint"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in AMOUNT_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN amount TYPE NUMERIC(24, 8) "
+            f"USING amount::numeric / {MINOR_UNITS_PER_UNIT}"
+        )
@@ -0,0 +1,30 @@
+"""cover user_created index."""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a8e2f17d90"
+down_revision: Union[str, Sequence[str], None] = "8b2e4d6f0a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("index_transactions_user_created", table_name="transactions", if_exists=True)
+    op.create_index(
+        "index_transactions_user_created",
+        "transactions",
+        ["user_id", "created"],
+        postgresql_include=["amount", "currency"],
+    )
+    op.drop_index("ix_transactions_status", table_name="transactions", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_transactions_status", "transactions", ["status"], if_not_exists=True)
+    op.drop_index("index_transactions_user_created", table_name="transactions", if_exists=True)
+    op.create_index("index_transactions_user_created", "transactions", ["user_id", "created"])
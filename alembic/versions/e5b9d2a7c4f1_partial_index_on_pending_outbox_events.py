@@ -0,0 +1,29 @@
+"""partial index on pending outbox events."""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9d2a7c4f1"
+down_revision: Union[str, Sequence[str], None] = "7c1e5a9d3f64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "index_outbox_events_pending_created",
+        "outbox_events",
+        ["created"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("index_outbox_events_pending_created", table_name="outbox_events", if_exists=True)
@@ -1,16 +1,25 @@
 """Reports API endpoints."""
 
-from typing import Dict, List
+from typing import Annotated, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from celery import group
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Response, status
+from pydantic import Field
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_async_session
+from app.cache import cache_get, cache_set, get_redis, weekly_report_cache_key
+from app.config import settings
+from app.database import get_read_session
+from app.responses import DecimalORJSONResponse
 from app.services.report_service import ReportService
 from app.tasks.report_tasks import generate_weekly_report_task
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+MAX_REPORT_WEEKS = 520
+MAX_BULK_REPORTS = 10
+
 
 @router.get(
     "/weekly",
@@ -21,11 +30,19 @@ router = APIRouter(prefix="/reports", tags=["reports"])
 )
 async def get_weekly_report(
     weeks: int = 52,
-    session: AsyncSession = Depends(get_async_session),
-) -> List[Dict]:
+    session: AsyncSession = Depends(get_read_session),
+    redis: Optional[Redis] = Depends(get_redis),
+) -> Response:
     """Get weekly transaction analysis report."""
+    key = weekly_report_cache_key(weeks)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = ReportService(session)
-    return await service.generate_weekly_report(weeks=weeks)
+    response = DecimalORJSONResponse(await service.generate_weekly_report(weeks=weeks))
+    await cache_set(redis, key, response.body, settings.weekly_report_cache_ttl)
+    return response
 
 
 @router.post(
@@ -45,3 +62,23 @@ async def generate_weekly_report_async(
         "task_id": task.id,
         "status": "PENDING",
     }
+
+
+@router.post(
+    "/weekly/async/bulk",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Generate several weekly reports (asynchronous)",
+    description="Trigger one background task per requested report length, published to the broker in a single batch.",
+)
+async def generate_weekly_reports_bulk(
+    weeks: List[Annotated[int, Field(ge=1, le=MAX_REPORT_WEEKS)]] = Body(
+        ..., min_length=1, max_length=MAX_BULK_REPORTS, embed=True
+    ),
+) -> Dict:
+    """Trigger bulk async report generation."""
+    result = group(generate_weekly_report_task.s(w) for w in weeks).apply_async()
+    return {
+        "message": "Report generation started",
+        "task_ids": [task.id for task in result.results],
+        "status": "PENDING",
+    }
@@ -2,11 +2,15 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import get_async_session
+from app.cache import cache_delete, get_redis, user_cache_key
+from app.database import get_async_session, get_read_session, get_session_maker
 from app.models.schemas import RequestTransactionModel, TransactionModel
+from app.responses import model_response, stream_json_array
 from app.services.transaction_service import TransactionService
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
@@ -23,10 +27,13 @@ async def create_transaction(
     user_id: int,
     transaction_data: RequestTransactionModel,
     session: AsyncSession = Depends(get_async_session),
-) -> TransactionModel:
+    redis: Optional[Redis] = Depends(get_redis),
+) -> Response:
     """Create a transaction."""
     service = TransactionService(session)
-    return await service.create_transaction(user_id, transaction_data)
+    transaction = await service.create_transaction(user_id, transaction_data)
+    await cache_delete(redis, user_cache_key(user_id))
+    return model_response(transaction, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -34,17 +41,44 @@ async def create_transaction(
     response_model=List[TransactionModel],
     status_code=status.HTTP_200_OK,
     summary="Get transactions",
-    description="Get list of transactions with optional user filter",
+    description=(
+        "Get list of transactions with optional user filter. Pass the last seen id as before_id "
+        "to page by keyset instead of skip"
+    ),
 )
 async def get_transactions(
     user_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
-    session: AsyncSession = Depends(get_async_session),
-) -> List[TransactionModel]:
+    before_id: Optional[int] = None,
+    session: AsyncSession = Depends(get_read_session),
+) -> Response:
     """Get transactions with optional filters."""
     service = TransactionService(session)
-    return await service.get_transactions(user_id=user_id, skip=skip, limit=limit)
+    return model_response(await service.get_transactions(user_id=user_id, skip=skip, limit=limit, before_id=before_id))
+
+
+@router.get(
+    "/export",
+    response_model=List[TransactionModel],
+    status_code=status.HTTP_200_OK,
+    summary="Export transactions",
+    description="Stream all transactions with optional user filter as a single JSON array",
+)
+async def export_transactions(
+    user_id: Optional[int] = None,
+    session_maker: async_sessionmaker = Depends(get_session_maker),
+) -> StreamingResponse:
+    """Export transactions without buffering the whole result set."""
+
+    async def content():
+        # Dependency sessions are closed before the body is sent, so the stream owns its session.
+        async with session_maker() as session:
+            service = TransactionService(session)
+            async for chunk in stream_json_array(service.stream_transactions(user_id=user_id)):
+                yield chunk
+
+    return StreamingResponse(content(), media_type="application/json")
 
 
 @router.patch(
@@ -58,7 +92,10 @@ async def rollback_transaction(
     user_id: int,
     transaction_id: int,
     session: AsyncSession = Depends(get_async_session),
-) -> TransactionModel:
+    redis: Optional[Redis] = Depends(get_redis),
+) -> Response:
     """Rollback a transaction."""
     service = TransactionService(session)
-    return await service.rollback_transaction(user_id, transaction_id)
+    transaction = await service.rollback_transaction(user_id, transaction_id)
+    await cache_delete(redis, user_cache_key(user_id))
+    return model_response(transaction)
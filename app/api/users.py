@@ -2,12 +2,16 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_async_session
+from app.cache import cache_delete, cache_get, cache_set, get_redis, user_cache_key
+from app.config import settings
+from app.database import get_async_session, get_read_session
 from app.models.enums import UserStatusEnumDB
 from app.models.schemas import UserCreateRequest, UserDetailResponse, UserResponse, UserUpdateRequest
+from app.responses import model_response
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -23,10 +27,11 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def create_user(
     user_data: UserCreateRequest,
     session: AsyncSession = Depends(get_async_session),
-) -> UserDetailResponse:
+) -> Response:
     """Create a new user."""
     service = UserService(session)
-    return await service.create_user(user_data)
+    user = await service.create_user(user_data)
+    return model_response(user, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -40,15 +45,16 @@ async def get_users(
     user_id: Optional[int] = None,
     email: Optional[str] = None,
     user_status: Optional[UserStatusEnumDB] = None,
-    session: AsyncSession = Depends(get_async_session),
-) -> List[UserDetailResponse]:
+    session: AsyncSession = Depends(get_read_session),
+) -> Response:
     """Get users with optional filters."""
     service = UserService(session)
-    return await service.get_users(
+    users = await service.get_users(
         user_id=user_id,
         email=email,
         status=user_status,
     )
+    return model_response(users)
 
 
 @router.get(
@@ -60,11 +66,19 @@ async def get_users(
 )
 async def get_user(
     user_id: int,
-    session: AsyncSession = Depends(get_async_session),
-) -> UserDetailResponse:
+    session: AsyncSession = Depends(get_read_session),
+    redis: Optional[Redis] = Depends(get_redis),
+) -> Response:
     """Get user by ID."""
+    key = user_cache_key(user_id)
+    cached = await cache_get(redis, key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = UserService(session)
-    return await service.get_user_by_id(user_id)
+    response = model_response(await service.get_user_by_id(user_id))
+    await cache_set(redis, key, response.body, settings.user_cache_ttl)
+    return response
 
 
 @router.patch(
@@ -78,7 +92,10 @@ async def update_user(
     user_id: int,
     update_data: UserUpdateRequest,
     session: AsyncSession = Depends(get_async_session),
-) -> UserResponse:
+    redis: Optional[Redis] = Depends(get_redis),
+) -> Response:
     """Update user status."""
     service = UserService(session)
-    return await service.update_user_status(user_id, update_data)
+    user = await service.update_user_status(user_id, update_data)
+    await cache_delete(redis, user_cache_key(user_id))
+    return model_response(user)
@@ -0,0 +1,57 @@
+"""Redis cache for read-heavy endpoints."""
+
+from typing import Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+redis_client = Redis.from_url(settings.redis_url)
+
+
+def user_cache_key(user_id: int) -> str:
+    """Build cache key for user details."""
+    return f"user:{user_id}:v1"
+
+
+def weekly_report_cache_key(weeks: int) -> str:
+    """Build cache key for weekly report."""
+    return f"weekly_report:{weeks}"
+
+
+async def get_redis() -> Optional[Redis]:
+    """Dependency that returns the shared Redis client, or None when caching is disabled."""
+    return redis_client if settings.cache_enabled else None
+
+
+async def cache_get(redis: Optional[Redis], key: str) -> Optional[bytes]:
+    """Get cached payload. Cache failures are treated as a miss."""
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except RedisError as e:
+        logger.warning("Cache read failed", key=key, error=str(e))
+        return None
+
+
+async def cache_set(redis: Optional[Redis], key: str, payload: bytes, ttl: int) -> None:
+    """Store payload in cache with TTL."""
+    if redis is None:
+        return
+    try:
+        await redis.set(key, payload, ex=ttl)
+    except RedisError as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
+
+
+async def cache_delete(redis: Optional[Redis], *keys: str) -> None:
+    """Invalidate cached payloads."""
+    if redis is None:
+        return
+    try:
+        await redis.delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache invalidation failed", keys=keys, error=str(e))
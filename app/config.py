@@ -1,5 +1,8 @@
 """Application settings."""
 
+from functools import cached_property, lru_cache
+from typing import List
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,30 +21,52 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
 
+    cors_origins: List[str] = ["http://localhost:3000"]
+
     db_host: str = "localhost"
     db_port: int = 5432
     db_name: str = "transaction_db"
     db_user: str = "postgres"
     db_password: str = "postgres"
     db_echo: bool = False
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    db_statement_cache_size: int = 200
+    db_pgbouncer: bool = False
 
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
 
+    cache_enabled: bool = True
+    user_cache_ttl: int = 60
+    weekly_report_cache_ttl: int = 300
+
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
+    celery_db_pool_size: int = 2
+    celery_db_max_overflow: int = 3
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct database URL."""
         return (
             f"postgresql+asyncpg://{self.db_user}:{self.db_password}" f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
+    @cached_property
     def redis_url(self) -> str:
         """Construct Redis URL."""
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance."""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,18 +1,42 @@
 """Database configuration and session management."""
 
+import asyncio
 from typing import AsyncGenerator
+from uuid import uuid4
 
+from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
+connect_args = {
+    "server_settings": {"jit": "off", "tcp_keepalives_idle": "60", "application_name": "transaction_api"},
+    "timeout": 10,
+    "command_timeout": 60,
+    "statement_cache_size": settings.db_statement_cache_size,
+    "prepared_statement_cache_size": settings.db_statement_cache_size,
+}
+
+if settings.db_pgbouncer:
+    # PgBouncer in transaction pooling mode can't keep prepared statements per client
+    # and rejects startup parameters it doesn't know, such as "jit". The statements asyncpg still
+    # prepares get unique names so they can't collide on a server connection shared by several clients.
+    connect_args["statement_cache_size"] = 0
+    connect_args["prepared_statement_cache_size"] = 0
+    connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    del connect_args["server_settings"]["jit"]
+    del connect_args["server_settings"]["tcp_keepalives_idle"]
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.db_echo,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args=connect_args,
 )
 
 async_session_maker = async_sessionmaker(
@@ -23,6 +47,18 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Behind PgBouncer in transaction mode every autocommit statement may land on a different server connection,
+# splitting asyncpg's prepare and execute apart, so reads keep a transaction there.
+read_engine = engine if settings.db_pgbouncer else engine.execution_options(isolation_level="AUTOCOMMIT")
+
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 Base = declarative_base()
 
 
@@ -34,11 +70,39 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting a session for read-only endpoints; autocommit unless running behind PgBouncer."""
+    async with read_session_maker() as session:
+        yield session
+
+
+def get_session_maker() -> async_sessionmaker:
+    """Dependency for endpoints that open their own session, e.g. one that must outlive a streamed response."""
+    return async_session_maker
 
 
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool() -> None:
+    """Open pool_size connections up front so the first requests skip the connect handshake."""
+    pool_size = engine.pool.size()
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(pool_size)),
+        return_exceptions=True,
+    )
+
+    failed = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            failed += 1
+        else:
+            await result.close()
+
+    if failed:
+        logger.warning("Connection pool warm-up incomplete", failed=failed, pool_size=pool_size)
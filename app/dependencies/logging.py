@@ -1,14 +1,8 @@
 """Dependencies for logging."""
 
-from fastapi import Request
 from loguru import logger
 
 
-def get_request_logger(request: Request):
-    """Dependency to retrieve the request-scoped loguru logger."""
-    if request and hasattr(request.state, "request_id"):
-        request_id = getattr(request.state, "request_id")
-    else:
-        request_id = "N/A_OUTSIDE_REQUEST"
-
-    return logger.bind(request_id=request_id)
+def get_request_logger():
+    """Dependency to retrieve the loguru logger; request_id is attached by the logging middleware's context."""
+    return logger
@@ -8,61 +8,73 @@ from fastapi import HTTPException, status
 class UserAlreadyExistsException(HTTPException):
     """Raised when attempting to create user with existing email."""
 
+    _DETAIL = "User with email '{}' already exists"
+
     def __init__(self, email: str) -> None:
         """Initialize the exception with the email."""
         super().__init__(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"User with email '{email}' already exists",
+            detail=self._DETAIL.format(email),
         )
 
 
 class UserNotExistsException(HTTPException):
     """Raised when user is not found."""
 
+    _DETAIL = "User with id '{}' not found"
+
     def __init__(self, user_id: int) -> None:
         """Initialize the exception with the user ID."""
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with id '{user_id}' not found",
+            detail=self._DETAIL.format(user_id),
         )
 
 
 class UserAlreadyBlockedException(HTTPException):
     """Raised when attempting to block an already blocked user."""
 
+    _DETAIL = "User with id '{}' is already blocked"
+
     def __init__(self, user_id: int) -> None:
         """Initialize the exception with the user ID."""
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User with id '{user_id}' is already blocked",
+            detail=self._DETAIL.format(user_id),
         )
 
 
 class UserAlreadyActiveException(HTTPException):
     """Raised when attempting to activate an already active user."""
 
+    _DETAIL = "User with id '{}' is already active"
+
     def __init__(self, user_id: int) -> None:
         """Initialize the exception with the user ID."""
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User with id '{user_id}' is already active",
+            detail=self._DETAIL.format(user_id),
         )
 
 
 class UserBlockedException(HTTPException):
     """Raised when attempting operations on a blocked user."""
 
+    _DETAIL = "Cannot perform '{}' for blocked user with id '{}'"
+
     def __init__(self, user_id: int, operation: str = "operation") -> None:
         """Initialize the exception with the user ID and operation."""
         super().__init__(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Cannot perform '{operation}' for blocked user with id '{user_id}'",
+            detail=self._DETAIL.format(operation, user_id),
         )
 
 
 class NegativeBalanceException(HTTPException):
     """Raised when operation would result in negative balance."""
 
+    _DETAIL = "Insufficient balance in {}. Current: {}, Requested: {}"
+
     def __init__(
         self,
         currency: str,
@@ -72,41 +84,57 @@ class NegativeBalanceException(HTTPException):
         """Initialize the exception with the currency, current balance, and requested amount."""
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=(
-                f"Insufficient balance in {currency}. "
-                f"Current: {current_balance}, Requested: {abs(requested_amount)}"
-            ),
+            detail=self._DETAIL.format(currency, current_balance, abs(requested_amount)),
+        )
+
+
+class BalanceNotFoundException(HTTPException):
+    """Raised when user has no balance in the requested currency."""
+
+    _DETAIL = "Balance in {} not found for user with id '{}'"
+
+    def __init__(self, user_id: int, currency: str) -> None:
+        """Initialize the exception with the user ID and currency."""
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=self._DETAIL.format(currency, user_id),
         )
 
 
 class TransactionNotFound(HTTPException):
     """Raised when transaction is not found."""
 
+    _DETAIL = "Transaction with id '{}' not found"
+
     def __init__(self, transaction_id: int) -> None:
         """Initialize the exception with the transaction ID."""
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transaction with id '{transaction_id}' not found",
+            detail=self._DETAIL.format(transaction_id),
         )
 
 
 class TransactionDoesNotBelongToUserException(HTTPException):
     """Raised when transaction doesn't belong to the specified user."""
 
+    _DETAIL = "Transaction with id '{}' does not belong to user with id '{}'"
+
     def __init__(self, transaction_id: int, user_id: int) -> None:
         """Initialize the exception with the transaction ID and user ID."""
         super().__init__(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=(f"Transaction with id '{transaction_id}' " f"does not belong to user with id '{user_id}'"),
+            detail=self._DETAIL.format(transaction_id, user_id),
         )
 
 
 class TransactionAlreadyRollbackedException(HTTPException):
     """Raised when attempting to rollback an already rollbacked transaction."""
 
+    _DETAIL = "Transaction with id '{}' is already reversed"
+
     def __init__(self, transaction_id: int) -> None:
         """Initialize the exception with the transaction ID."""
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Transaction with id '{transaction_id}' is already reversed",
+            detail=self._DETAIL.format(transaction_id),
         )
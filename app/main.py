@@ -1,31 +1,50 @@
 """Main FastAPI application."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import reports, transactions, users
+from app.cache import redis_client
 from app.config import settings
-from app.database import init_db
+from app.database import engine, init_db, warm_pool
 from app.logging import setup_logging
 from app.middleware.logger import logging_middleware
+from app.responses import DecimalORJSONResponse
 
 setup_logging(log_level=settings.log_level or "INFO", app_name=settings.app_name)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Initialize database and warm the connection pool on startup, release connections on shutdown."""
+    await init_db()
+    await warm_pool()
+    yield
+    await redis_client.aclose()
+    await engine.dispose()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DecimalORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH"],
+    allow_headers=["authorization", "content-type", "x-request-id"],
+    expose_headers=["x-request-id"],
 )
 app.middleware("http")(logging_middleware)
 
@@ -35,12 +54,6 @@ app.include_router(transactions.router)
 app.include_router(reports.router)
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Initialize database on startup."""
-    await init_db()
-
-
 @app.get("/", tags=["health"])
 async def health_check() -> dict:
     """Health check endpoint."""
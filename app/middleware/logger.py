@@ -1,26 +1,33 @@
 """Middleware to log requests and responses."""
 
 import time
+from uuid import uuid4
 
 from fastapi import Request
 from loguru import logger
 
+REQUEST_ID_HEADER = "X-Request-Id"
+
 
 async def logging_middleware(request: Request, call_next):
     """Middleware to log requests and responses."""
-    start_time = time.perf_counter()
-    response = None
-    try:
-        response = await call_next(request)
-        return response
-    finally:
-        process_time = (time.perf_counter() - start_time) * 1000
+    request_id = request.headers.get(REQUEST_ID_HEADER) or uuid4().hex
+    request.state.request_id = request_id
+
+    with logger.contextualize(request_id=request_id):
+        start_time = time.perf_counter()
+        response = None
+        try:
+            response = await call_next(request)
+            response.headers[REQUEST_ID_HEADER] = request_id
+            return response
+        finally:
+            process_time = (time.perf_counter() - start_time) * 1000
 
-        logger.info(
-            "HTTP request completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=getattr(response, "status_code", "N/A"),
-            duration_ms=round(process_time, 2),
-            client=request.client.host if request.client else None,
-        )
+            logger.bind(
+                method=request.method,
+                path=request.url.path,
+                status_code=getattr(response, "status_code", "N/A"),
+                duration_ms=round(process_time, 2),
+                client=request.client.host if request.client else None,
+            ).info("HTTP request completed")
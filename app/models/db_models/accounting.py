@@ -1,6 +1,19 @@
 """Module containing schemas for reports."""
 
-from sqlalchemy import JSON, Boolean, CheckConstraint, Column, DateTime, Enum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -33,8 +46,8 @@ class Account(Base):
     entries = relationship(
         "JournalEntry",
         back_populates="account",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
     )
 
     def __repr__(self) -> str:
@@ -90,6 +103,9 @@ class OutboxEvent(Base):
     """Transaction outbox event."""
 
     __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index("index_outbox_events_pending_created", "created", postgresql_where=text("status = 'PENDING'")),
+    )
 
     id = Column(Integer, primary_key=True)
     aggregate_type = Column(String(100), nullable=False)
@@ -1,10 +1,11 @@
 """Middleware to log requests and responses."""
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.db_models.types import MinorUnitAmount
 from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
 
 
@@ -13,41 +14,49 @@ class Transaction(Base):
 
     __tablename__ = "transactions"
     __table_args__ = (
-        Index("index_transactions_user_created", "user_id", "created"),
-        Index("index_transactions_status_created", "status", "created"),
+        Index("index_transactions_user_created", "user_id", "created", postgresql_include=["amount", "currency"]),
+        Index("index_transactions_status_created", "status", "created", postgresql_include=["amount", "currency"]),
+        Index(
+            "index_transactions_created_status",
+            "created",
+            "status",
+            postgresql_include=["user_id", "amount", "currency"],
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
         index=True,
     )
-    currency = Column(Enum(CurrencyEnumDB), nullable=False, index=True)
-    amount = Column(Numeric(precision=24, scale=8), nullable=False)
+    currency = Column(Enum(CurrencyEnumDB, native_enum=False, length=4), nullable=False, index=True)
+    amount = Column(MinorUnitAmount, nullable=False)
     status = Column(
         Enum(TransactionStatusEnumDB),
         nullable=False,
         default=TransactionStatusEnumDB.DRAFT,
-        index=True,
     )
-    created = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    created = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="transactions")
 
     entries = relationship(
         "JournalEntry",
         back_populates="transaction",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="raise",
     )
     outbox_event = relationship(
         "OutboxEvent",
         back_populates="transaction",
         uselist=False,
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,38 @@
+"""Custom column types."""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional, Union
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+AMOUNT_SCALE = 8
+
+
+def to_minor_units(amount: Union[Decimal, int, float, str]) -> int:
+    """Convert an amount to an integer count of 10**-AMOUNT_SCALE units."""
+    return int(Decimal(str(amount)).scaleb(AMOUNT_SCALE).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_minor_units(value: Union[int, Decimal]) -> Decimal:
+    """Convert an integer count of minor units back to a Decimal amount."""
+    return Decimal(value).scaleb(-AMOUNT_SCALE)
+
+
+
+# Largest amount whose minor units still fit in a signed BIGINT column.
+MAX_AMOUNT = from_minor_units(2**63 - 1)
+
+class MinorUnitAmount(TypeDecorator):
+    """Decimal amount stored as a BIGINT of minor units, so sums and I/O run on 8-byte integers."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        """Convert a Decimal amount to minor units on the way in."""
+        return None if value is None else to_minor_units(value)
+
+    def process_result_value(self, value, dialect) -> Optional[Decimal]:
+        """Convert minor units back to a Decimal amount on the way out."""
+        return None if value is None else from_minor_units(value)
@@ -1,10 +1,11 @@
 """Middleware to log requests and responses."""
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.db_models.types import MinorUnitAmount
 from app.models.enums import CurrencyEnumDB, UserStatusEnumDB
 
 
@@ -12,8 +13,9 @@ class User(Base):
     """User model."""
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String(255), nullable=False, unique=True, index=True)
     status = Column(
         Enum(UserStatusEnumDB),
@@ -26,15 +28,18 @@ class User(Base):
     balances = relationship(
         "UserBalance",
         back_populates="user",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
-        lazy="selectin",
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="joined",
+        innerjoin=False,
+        order_by="UserBalance.currency",
     )
     transactions = relationship(
         "Transaction",
         back_populates="user",
-        cascade="all, delete-orphan",
-        passive_deletes=True,
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -50,16 +55,17 @@ class UserBalance(Base):
         UniqueConstraint("user_id", "currency", name="unique_user_balance_user_currency"),
         Index("index_user_balances_user_currency", "user_id", "currency"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
         index=True,
     )
-    currency = Column(Enum(CurrencyEnumDB), nullable=False)
-    amount = Column(Numeric(precision=24, scale=8), nullable=False, default=0)
+    currency = Column(Enum(CurrencyEnumDB, native_enum=False, length=4), nullable=False)
+    amount = Column(MinorUnitAmount, nullable=False, default=0)
     created = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="balances")
@@ -1,5 +1,6 @@
 """This module contains all the schemas used in the application."""
 
+from app.models.schemas.report import WeeklyReport
 from app.models.schemas.transaction import RequestTransactionModel, TransactionModel
 from app.models.schemas.user import (
     BalanceResponse,
@@ -17,4 +18,5 @@ __all__ = [
     "UserDetailResponse",
     "RequestTransactionModel",
     "TransactionModel",
+    "WeeklyReport",
 ]
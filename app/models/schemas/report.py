@@ -23,7 +23,4 @@ class WeeklyReport(BaseModel):
     total_transactions_count: int = Field(..., ge=0)
     posted_transactions_count: int = Field(..., ge=0)
 
-    class Config:
-        """Weekly report schema configuration."""
-
-        from_attributes = True
+    model_config = {"from_attributes": True}
@@ -4,8 +4,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
+from app.models.db_models.types import MAX_AMOUNT
 from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
 
 
@@ -13,7 +14,13 @@ class RequestTransactionModel(BaseModel):
     """Request model for creating a transaction."""
 
     currency: CurrencyEnumDB
-    amount: Decimal
+    amount: Decimal = Field(..., gt=-MAX_AMOUNT, lt=MAX_AMOUNT)
+
+    @field_validator("currency", mode="before")
+    @classmethod
+    def coerce_currency(cls, v):
+        """Resolve the currency member by value before enum validation."""
+        return CurrencyEnumDB._value2member_map_.get(v, v) if isinstance(v, str) else v
 
 
 class TransactionModel(BaseModel):
@@ -1,34 +1,55 @@
 """User schemas module."""
 
-import re
+import string
 from datetime import datetime
 from decimal import Decimal
 from typing import List
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.enums import CurrencyEnumDB, UserStatusEnumDB
 
+_ASCII_ALNUM = string.ascii_letters + string.digits
+_EMAIL_LOCAL_CHARS = str.maketrans("", "", _ASCII_ALNUM + "._%+-")
+_EMAIL_DOMAIN_CHARS = str.maketrans("", "", _ASCII_ALNUM + ".-")
+
+
+def _is_valid_email(value: str) -> bool:
+    """Check value against local@domain.tld in a single linear pass without a regex."""
+    at = value.find("@")
+    dot = value.rfind(".")
+    if at < 1 or dot < at + 2:
+        return False
+
+    local, domain, tld = value[:at], value[at + 1 : dot], value[dot + 1 :]
+    return (
+        len(tld) >= 2
+        and tld.isascii()
+        and tld.isalpha()
+        and not local.translate(_EMAIL_LOCAL_CHARS)
+        and not domain.translate(_EMAIL_DOMAIN_CHARS)
+    )
+
 
 class UserCreateRequest(BaseModel):
     """Request schema for creating a user."""
 
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address")
 
     @field_validator("email")
     @classmethod
     def validate_email(cls, v: str) -> str:
-        """Validate that email is not just white."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        """Validate email format and normalize the domain to lower case."""
+        cleaned = v.strip()
 
-        if not v or not v.strip():
+        if not cleaned:
             raise ValueError("Email can't be empty")
 
-        cleaned = v.strip()
-
-        if not re.match(pattern, cleaned):
+        if not _is_valid_email(cleaned):
             raise ValueError("Uncorrect email format")
-        return cleaned
+
+        local, _, domain = cleaned.partition("@")
+        return f"{local}@{domain.lower()}"
 
 
 class UserUpdateRequest(BaseModel):
@@ -36,6 +57,12 @@ class UserUpdateRequest(BaseModel):
 
     status: UserStatusEnumDB = Field(..., description="New user status")
 
+    @field_validator("status", mode="before")
+    @classmethod
+    def coerce_status(cls, v):
+        """Resolve the status member by value before enum validation."""
+        return UserStatusEnumDB._value2member_map_.get(v, v) if isinstance(v, str) else v
+
 
 class BalanceResponse(BaseModel):
     """Response schema for user balance."""
@@ -43,10 +70,7 @@ class BalanceResponse(BaseModel):
     currency: CurrencyEnumDB
     amount: Decimal = Field(..., ge=0, description="Balance amount (non-negative)")
 
-    model_config = {
-        "from_attributes": True,
-        "json_encoders": {Decimal: lambda v: Decimal(v)},
-    }
+    model_config = {"from_attributes": True}
 
 
 class UserResponse(BaseModel):
@@ -1,7 +1,7 @@
 """Accounting repository module."""
 
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import List, Optional
 
 from sqlalchemy import func, select
@@ -11,6 +11,18 @@ from sqlalchemy.orm import selectinload
 from app.models.db_models.accounting import Account, JournalEntry, OutboxEvent
 from app.models.db_models.transaction import Transaction
 
+ENTRY_AMOUNT_SCALE = 4
+
+
+def _to_minor_units(amount) -> int:
+    """Convert an entry amount to integer minor units at the journal entry column scale."""
+    return int(Decimal(str(amount)).scaleb(ENTRY_AMOUNT_SCALE).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_minor_units(minor_amount: int) -> Decimal:
+    """Convert integer minor units back to a Decimal amount."""
+    return Decimal(minor_amount).scaleb(-ENTRY_AMOUNT_SCALE)
+
 
 class AccountingRepository:
     """Repository for accounting operations."""
@@ -27,18 +39,15 @@ class AccountingRepository:
         created_by: Optional[str] = None,
     ) -> Transaction:
         """Create a transaction with journal entries, checking the double-entry rule."""
-        total_debit = Decimal("0")
-        total_credit = Decimal("0")
-
-        for entry in entries_data:
-            amount = Decimal(str(entry["amount"]))
-            if entry["entry_type"] == "DEBIT":
-                total_debit += amount
-            elif entry["entry_type"] == "CREDIT":
-                total_credit += amount
+        minor_amounts = [_to_minor_units(entry["amount"]) for entry in entries_data]
+        total_debit = sum(m for m, e in zip(minor_amounts, entries_data) if e["entry_type"] == "DEBIT")
+        total_credit = sum(m for m, e in zip(minor_amounts, entries_data) if e["entry_type"] == "CREDIT")
 
         if total_debit != total_credit:
-            raise ValueError(f"Rule violation: " f"Debit ({total_debit}) does not equal Credit ({total_credit})")
+            raise ValueError(
+                f"Rule violation: "
+                f"Debit ({_from_minor_units(total_debit)}) does not equal Credit ({_from_minor_units(total_credit)})"
+            )
 
         transaction = Transaction(
             description=description,
@@ -49,12 +58,12 @@ class AccountingRepository:
         self.session.add(transaction)
         await self.session.flush()
 
-        for entry_data in entries_data:
+        for entry_data, minor_amount in zip(entries_data, minor_amounts):
             entry = JournalEntry(
                 transaction_id=transaction.id,
                 account_id=entry_data["account_id"],
                 entry_type=entry_data["entry_type"],
-                amount=Decimal(str(entry_data["amount"])),
+                amount=_from_minor_units(minor_amount),
                 description=entry_data.get("description"),
             )
             self.session.add(entry)
@@ -116,24 +125,18 @@ class AccountingRepository:
 
     async def get_trial_balance(self, as_of_date: Optional[datetime] = None) -> List[dict]:
         """Get trial balance."""
+        total_debit = func.coalesce(func.sum(JournalEntry.amount).filter(JournalEntry.entry_type == "DEBIT"), 0)
+        total_credit = func.coalesce(func.sum(JournalEntry.amount).filter(JournalEntry.entry_type == "CREDIT"), 0)
+
         query = (
             select(
                 Account.id,
                 Account.code,
                 Account.name,
                 Account.account_type,
-                func.sum(
-                    func.case(
-                        (JournalEntry.entry_type == "DEBIT", JournalEntry.amount),
-                        else_=0,
-                    )
-                ).label("total_debit"),
-                func.sum(
-                    func.case(
-                        (JournalEntry.entry_type == "CREDIT", JournalEntry.amount),
-                        else_=0,
-                    )
-                ).label("total_credit"),
+                total_debit.label("total_debit"),
+                total_credit.label("total_credit"),
+                (total_debit - total_credit).label("balance"),
             )
             .join(JournalEntry, JournalEntry.account_id == Account.id)
             .join(Transaction, Transaction.id == JournalEntry.transaction_id)
@@ -146,19 +149,15 @@ class AccountingRepository:
 
         result = await self.session.execute(query)
 
-        trial_balance = []
-        for row in result:
-            balance = row.total_debit - row.total_credit
-            trial_balance.append(
-                {
-                    "account_id": row.id,
-                    "account_code": row.code,
-                    "account_name": row.name,
-                    "account_type": row.account_type,
-                    "debit": Decimal(row.total_debit),
-                    "credit": Decimal(row.total_credit),
-                    "balance": Decimal(balance),
-                }
-            )
-
-        return trial_balance
+        return [
+            {
+                "account_id": row.id,
+                "account_code": row.code,
+                "account_name": row.name,
+                "account_type": row.account_type,
+                "debit": row.total_debit,
+                "credit": row.total_credit,
+                "balance": row.balance,
+            }
+            for row in result
+        ]
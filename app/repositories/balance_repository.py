@@ -1,9 +1,9 @@
 """User balance repository."""
 
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import NegativeBalanceException
@@ -26,14 +26,20 @@ class BalanceRepository(BaseRepository[UserBalance]):
     ) -> Optional[UserBalance]:
         """Get balance by user and currency."""
         result = await self.session.execute(
-            select(UserBalance).where(UserBalance.user_id == user_id).where(UserBalance.currency == currency)
+            lambda_stmt(
+                lambda: select(UserBalance)
+                .where(UserBalance.user_id == user_id)
+                .where(UserBalance.currency == currency)
+            )
         )
         return result.scalar_one_or_none()
 
     async def get_user_balances(self, user_id: int) -> List[UserBalance]:
         """Get all balances for a user."""
         result = await self.session.execute(
-            select(UserBalance).where(UserBalance.user_id == user_id).order_by(UserBalance.currency)
+            lambda_stmt(
+                lambda: select(UserBalance).where(UserBalance.user_id == user_id).order_by(UserBalance.currency)
+            )
         )
         return list(result.scalars().all())
 
@@ -42,42 +48,60 @@ class BalanceRepository(BaseRepository[UserBalance]):
         user_id: int,
         currency: CurrencyEnumDB,
         amount_delta: Decimal,
-    ) -> UserBalance:
-        """Update balance by adding delta to current amount."""
-        balance = await self.get_by_user_and_currency(user_id, currency)
-
-        if balance is None:
-            raise ValueError(f"Balance not found for user {user_id} and currency {currency}")
-
-        new_amount = balance.amount + amount_delta
+    ) -> Decimal:
+        """Atomically add delta to the balance unless it would go negative and return the new amount."""
+        new_amount = await self.session.scalar(
+            update(UserBalance)
+            .where(UserBalance.user_id == user_id)
+            .where(UserBalance.currency == currency)
+            .where(UserBalance.amount + amount_delta >= 0)
+            .values(amount=UserBalance.amount + amount_delta)
+            .returning(UserBalance.amount)
+        )
 
-        if new_amount < 0:
+        if new_amount is None:
+            balance = await self.get_by_user_and_currency(user_id, currency)
+            if balance is None:
+                raise ValueError(f"Balance not found for user {user_id} and currency {currency}")
             raise NegativeBalanceException(
-                f"Insufficient balance: current={balance.amount}, delta={amount_delta}, result={new_amount}"
+                currency=str(currency),
+                current_balance=Decimal(balance.amount),
+                requested_amount=Decimal(amount_delta),
             )
 
-        balance.amount = new_amount
-        await self.session.flush()
-        await self.session.refresh(balance)
-
-        return balance
+        return new_amount
 
     async def create_all_currency_balances(self, user_id: int) -> List[UserBalance]:
-        """Create zero balances for all currencies for a user."""
-        balances = []
-
-        for currency in CurrencyEnumDB:
-            balance = UserBalance(
-                user_id=user_id,
-                currency=currency,
-                amount=Decimal("0"),
-            )
-            self.session.add(balance)
-            balances.append(balance)
-
-        await self.session.flush()
-
-        for balance in balances:
-            await self.session.refresh(balance)
+        """Create zero balances for all currencies for a user in a single INSERT."""
+        result = await self.session.scalars(
+            insert(UserBalance).returning(UserBalance),
+            [{"user_id": user_id, "currency": currency, "amount": Decimal("0")} for currency in CurrencyEnumDB],
+        )
+        return list(result.all())
+
+    async def create_all_currency_balances_for_users(self, user_ids: Sequence[int]) -> None:
+        """Create zero balances for all currencies for many users in a single batched INSERT."""
+        await self.session.execute(
+            insert(UserBalance),
+            [
+                {"user_id": user_id, "currency": currency, "amount": Decimal("0")}
+                for user_id in user_ids
+                for currency in CurrencyEnumDB
+            ],
+        )
 
-        return balances
+    async def set_amounts(self, amounts: Mapping[Tuple[int, CurrencyEnumDB], Decimal]) -> None:
+        """Overwrite many balances, keyed by (user_id, currency), in one executemany UPDATE."""
+        if not amounts:
+            return
+        table = UserBalance.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.user_id == bindparam("balance_user_id"))
+            .where(table.c.currency == bindparam("balance_currency"))
+            .values(amount=bindparam("new_amount")),
+            [
+                {"balance_user_id": user_id, "balance_currency": currency, "new_amount": amount}
+                for (user_id, currency), amount in amounts.items()
+            ],
+        )
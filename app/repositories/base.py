@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
-from typing import Generic, List, Optional, Type, TypeVar
+from datetime import datetime
+from typing import AsyncIterator, Generic, List, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Case, Select, case, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import Base
@@ -9,6 +10,11 @@ from app.database import Base
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def week_bucket(column, boundaries: Sequence[datetime]) -> Case:
+    """Number the week a timestamp falls into, given boundaries from newest to oldest; NULL before the oldest"""
+    return case(*[(column >= boundary, week) for week, boundary in enumerate(boundaries[1:])])
+
+
 class BaseRepository(Generic[ModelType]):
     """Base repository with CRUD operations and transaction management"""
 
@@ -30,10 +36,9 @@ class BaseRepository(Generic[ModelType]):
 
     async def get_by_id(self, id: int) -> Optional[ModelType]:
         """Get entity by ID"""
-        result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
-        )
-        return result.scalar_one_or_none()
+        model = self.model
+        result = await self.session.execute(lambda_stmt(lambda: select(model).where(model.id == id)))
+        return result.unique().scalar_one_or_none()
 
     async def get_all(
         self,
@@ -48,14 +53,23 @@ class BaseRepository(Generic[ModelType]):
             query = query.order_by(getattr(self.model, order_by))
 
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return list(result.unique().scalars().all())
+
+    async def stream_all(self, query: Optional[Select] = None, partition_size: int = 500) -> AsyncIterator[ModelType]:
+        """Stream entities through a server-side cursor, holding one partition in memory at a time"""
+        if query is None:
+            query = select(self.model)
+
+        result = await self.session.stream_scalars(query.execution_options(yield_per=partition_size))
+        async for partition in result.partitions():
+            for instance in partition:
+                yield instance
 
     async def create(self, **kwargs) -> ModelType:
         """Create new entity"""
         instance = self.model(**kwargs)
         self.session.add(instance)
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
 
     async def update(self, instance: ModelType, **kwargs) -> ModelType:
@@ -65,7 +79,6 @@ class BaseRepository(Generic[ModelType]):
                 setattr(instance, key, value)
 
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
 
     async def delete(self, instance: ModelType) -> None:
@@ -2,24 +2,48 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import AsyncIterator, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Numeric, Row, Select, case, distinct, func, insert, literal, select, tuple_, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from app.models.db_models.transaction import Transaction
-from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
-from app.repositories.base import BaseRepository
+from app.models.db_models.types import MinorUnitAmount, to_minor_units
+from app.models.db_models.user import User
+from app.models.enums import TransactionStatusEnumDB
+from app.repositories.base import BaseRepository, week_bucket
 
 
 class TransactionRepository(BaseRepository[Transaction]):
     """Repository for Transaction operations."""
 
+    BULK_COLUMNS = ("user_id", "currency", "amount", "status")
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize TransactionRepository."""
         super().__init__(Transaction, session)
 
+    async def bulk_insert(self, records: Sequence[Tuple]) -> int:
+        """Insert raw (user_id, currency, amount, status) rows, using COPY on PostgreSQL."""
+        connection = await self.session.connection()
+
+        if connection.dialect.name == "postgresql":
+            # COPY bypasses the column type, so amounts are converted to minor units here.
+            rows = [
+                (user_id, currency, to_minor_units(amount), status) for user_id, currency, amount, status in records
+            ]
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                Transaction.__tablename__,
+                records=rows,
+                columns=self.BULK_COLUMNS,
+            )
+        else:
+            await self.session.execute(insert(Transaction), [dict(zip(self.BULK_COLUMNS, r)) for r in records])
+
+        return len(records)
+
     async def get_by_id_with_entries(self, transaction_id: int) -> Optional[Transaction]:
         """Get transaction by ID with its journal entries preloaded."""
         result = await self.session.execute(
@@ -27,123 +51,119 @@ class TransactionRepository(BaseRepository[Transaction]):
         )
         return result.unique().scalar_one_or_none()
 
+    async def get_rollback_context(self, user_id: int, transaction_id: int) -> Optional[Row]:
+        """Load the user with balances and the transaction in one query; the transaction is None if missing."""
+        result = await self.session.execute(
+            select(User, Transaction).outerjoin(Transaction, Transaction.id == transaction_id).where(User.id == user_id)
+        )
+        return result.unique().first()
+
+    async def reverse_if_not_reversed(self, transaction_id: int) -> Optional[Row]:
+        """Mark the transaction REVERSED unless it already is; returns the updated row or None if nothing changed."""
+        result = await self.session.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id)
+            .where(Transaction.status != TransactionStatusEnumDB.REVERSED)
+            .values(status=TransactionStatusEnumDB.REVERSED)
+            .returning(
+                Transaction.id,
+                Transaction.user_id,
+                Transaction.currency,
+                Transaction.amount,
+                Transaction.status,
+                Transaction.created,
+            )
+        )
+        return result.one_or_none()
+
     async def get_user_transactions(
         self,
         user_id: int,
         skip: int = 0,
         limit: int = 100,
+        before_id: Optional[int] = None,
     ) -> List[Transaction]:
         """Get transactions for a user."""
-        result = await self.session.execute(
-            select(Transaction)
-            .where(Transaction.user_id == user_id)
-            .order_by(Transaction.created.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        query = select(Transaction).where(Transaction.user_id == user_id)
+        result = await self.session.execute(self._paginate(query, skip, limit, before_id))
         return list(result.scalars().all())
 
     async def get_all_transactions(
         self,
         skip: int = 0,
         limit: int = 100,
+        before_id: Optional[int] = None,
     ) -> List[Transaction]:
         """Get all transactions."""
-        result = await self.session.execute(
-            select(Transaction).order_by(Transaction.created.desc()).offset(skip).limit(limit)
-        )
+        result = await self.session.execute(self._paginate(select(Transaction), skip, limit, before_id))
         return list(result.scalars().all())
 
-    async def count_in_period(
-        self,
-        start_date: datetime,
-        end_date: datetime,
-        status: Optional[TransactionStatusEnumDB] = None,
-    ) -> int:
-        """Count transactions in period."""
-        query = (
-            select(func.count())
-            .select_from(Transaction)
-            .where(Transaction.created >= start_date)
-            .where(Transaction.created <= end_date)
-        )
+    @staticmethod
+    def _paginate(query: Select, skip: int, limit: int, before_id: Optional[int]) -> Select:
+        """Page newest first by (created, id); before_id continues after that row by keyset instead of offset."""
+        query = query.order_by(Transaction.created.desc(), Transaction.id.desc()).limit(limit)
+        if before_id is None:
+            return query.offset(skip)
 
-        if status is not None:
-            query = query.where(Transaction.status == status)
+        cursor = aliased(Transaction)
+        cursor_created = select(cursor.created).where(cursor.id == before_id).scalar_subquery()
+        return query.where(tuple_(Transaction.created, Transaction.id) < tuple_(cursor_created, before_id))
 
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+    def stream_transactions(self, user_id: Optional[int] = None) -> AsyncIterator[Transaction]:
+        """Stream all transactions, optionally for one user, oldest first."""
+        query = select(Transaction).order_by(Transaction.id)
 
-    async def get_transactions_in_period(
-        self,
-        start_date: datetime,
-        end_date: datetime,
-        status: Optional[TransactionStatusEnumDB] = None,
-        amount_condition: Optional[str] = None,
-    ) -> List[Transaction]:
-        """Get transactions in period with filters."""
-        query = select(Transaction).where(Transaction.created >= start_date).where(Transaction.created <= end_date)
-
-        if status is not None:
-            query = query.where(Transaction.status == status)
-
-        if amount_condition == "positive":
-            query = query.where(Transaction.amount > 0)
-        elif amount_condition == "negative":
-            query = query.where(Transaction.amount < 0)
+        if user_id is not None:
+            query = query.where(Transaction.user_id == user_id)
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return self.stream_all(query)
 
-    async def sum_amount_in_period(
+    async def get_weekly_summaries(
         self,
-        start_date: datetime,
-        end_date: datetime,
-        currency: Optional[CurrencyEnumDB] = None,
-        status: Optional[TransactionStatusEnumDB] = None,
-        amount_condition: Optional[str] = None,
-    ) -> Decimal:
-        """Sum transaction amounts in period."""
-        query = (
-            select(func.sum(Transaction.amount))
-            .where(Transaction.created >= start_date)
-            .where(Transaction.created <= end_date)
+        boundaries: Sequence[datetime],
+        rates_to_usd: Mapping[str, Decimal],
+    ) -> List[Row]:
+        """Aggregate the weekly report figures, USD totals included, for every week between boundaries."""
+        week = week_bucket(Transaction.created, boundaries)
+        posted = Transaction.status == TransactionStatusEnumDB.POSTED
+        deposit = Transaction.amount > 0
+        withdrawal = Transaction.amount < 0
+        registered_same_week = week_bucket(User.created, boundaries) == week
+
+        usd_amount = Transaction.amount * case(
+            {currency: literal(rate, Numeric()) for currency, rate in rates_to_usd.items()},
+            value=Transaction.currency,
+            else_=literal(1, Numeric()),
         )
 
-        if currency is not None:
-            query = query.where(Transaction.currency == currency)
-
-        if status is not None:
-            query = query.where(Transaction.status == status)
-
-        if amount_condition == "positive":
-            query = query.where(Transaction.amount > 0)
-        elif amount_condition == "negative":
-            query = query.where(Transaction.amount < 0)
-
-        result = await self.session.execute(query)
-        total = result.scalar()
-
-        return Decimal(str(total)) if total is not None else Decimal("0")
-
-    async def count_users_with_deposits_in_period(
-        self,
-        start_date: datetime,
-        end_date: datetime,
-        user_ids: List[int],
-        include_rollbacked: bool = True,
-    ) -> int:
-        """Count users who made deposits in period."""
+        week_label = week.label("week")
         query = (
-            select(func.count(func.distinct(Transaction.user_id)))
-            .where(Transaction.user_id.in_(user_ids))
-            .where(Transaction.created >= start_date)
-            .where(Transaction.created <= end_date)
-            .where(Transaction.amount > 0)
+            select(
+                week_label,
+                func.count(distinct(Transaction.user_id))
+                .filter(registered_same_week, deposit)
+                .label("users_with_deposits_count"),
+                func.count(distinct(Transaction.user_id))
+                .filter(registered_same_week, posted, deposit)
+                .label("users_with_posted_deposits_count"),
+                func.count(distinct(Transaction.user_id))
+                .filter(registered_same_week, posted, withdrawal)
+                .label("users_with_posted_withdrawals_count"),
+                func.count().label("total_transactions_count"),
+                func.count().filter(posted).label("posted_transactions_count"),
+                type_coerce(func.round(func.sum(usd_amount).filter(posted, deposit)), MinorUnitAmount).label(
+                    "deposits_usd"
+                ),
+                type_coerce(func.round(func.sum(usd_amount).filter(posted, withdrawal)), MinorUnitAmount).label(
+                    "withdrawals_usd"
+                ),
+            )
+            .select_from(Transaction)
+            .join(User, User.id == Transaction.user_id)
+            .where(Transaction.created >= boundaries[-1])
+            .where(Transaction.created < boundaries[0])
+            .group_by(week_label)
         )
 
-        if not include_rollbacked:
-            query = query.where(Transaction.status == TransactionStatusEnumDB.DRAFT)
-
         result = await self.session.execute(query)
-        return result.scalar() or 0
+        return list(result.all())
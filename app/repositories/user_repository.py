@@ -1,14 +1,15 @@
 """Repository for User operations."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.models.db_models.user import User
 from app.models.enums import UserStatusEnumDB
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, week_bucket
 
 
 class UserRepository(BaseRepository[User]):
@@ -21,12 +22,35 @@ class UserRepository(BaseRepository[User]):
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
         result = await self.session.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
+
+    async def bulk_create(self, emails: Sequence[str]) -> List[int]:
+        """Insert active users for all emails in one statement and return their ids in input order."""
+        result = await self.session.scalars(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [{"email": email, "status": UserStatusEnumDB.ACTIVE} for email in emails],
+        )
+        return list(result.all())
+
+    async def update_status_if_different(self, user_id: int, status: UserStatusEnumDB) -> Optional[Row]:
+        """Set the status unless it already has that value; returns the updated row or None if nothing changed."""
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .where(User.status != status)
+            .values(status=status)
+            .returning(User.id, User.email, User.status, User.created)
+        )
+        return result.one_or_none()
+
+    async def get_status(self, user_id: int) -> Optional[UserStatusEnumDB]:
+        """Get the status of a user, or None if the user does not exist."""
+        return await self.session.scalar(select(User.status).where(User.id == user_id))
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         result = await self.session.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_with_filters(
         self,
@@ -34,8 +58,8 @@ class UserRepository(BaseRepository[User]):
         email: Optional[str] = None,
         status: Optional[UserStatusEnumDB] = None,
     ) -> List[User]:
-        """Get users with filters."""
-        query = select(User).order_by(User.created.desc())
+        """Get users with filters and their balances preloaded."""
+        query = select(User).options(selectinload(User.balances), raiseload("*")).order_by(User.created.desc())
 
         if user_id is not None:
             query = query.where(User.id == user_id)
@@ -49,24 +73,15 @@ class UserRepository(BaseRepository[User]):
 
     async def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
-        result = await self.session.execute(select(func.count()).select_from(User).where(User.email == email))
-        count = result.scalar()
-        return count > 0
+        return await self.session.scalar(select(User.id).where(User.email == email).limit(1)) is not None
 
-    async def count_registered_in_period(
-        self,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> int:
-        """Count users registered in period."""
+    async def count_registered_by_week(self, boundaries: Sequence[datetime]) -> Dict[int, int]:
+        """Count users registered in each week between boundaries ordered from newest to oldest."""
+        week = week_bucket(User.created, boundaries).label("week")
         result = await self.session.execute(
-            select(func.count()).select_from(User).where(User.created >= start_date).where(User.created <= end_date)
+            select(week, func.count())
+            .where(User.created >= boundaries[-1])
+            .where(User.created < boundaries[0])
+            .group_by(week)
         )
-        return result.scalar() or 0
-
-    async def get_registered_in_period(self, start_date: datetime, end_date: datetime) -> List[User]:
-        """Get users registered in period."""
-        result = await self.session.execute(
-            select(User).where(User.created >= start_date).where(User.created <= end_date)
-        )
-        return list(result.scalars().all())
+        return dict(result.tuples().all())
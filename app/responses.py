@@ -0,0 +1,67 @@
+"""Response classes."""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, List, Sequence, Type, Union
+
+import orjson
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize content with the options shared by all JSON responses."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build the adapter for a list of models once per model class."""
+    return TypeAdapter(List[model])
+
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """orjson response that keeps Decimal amounts as exact strings."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes."""
+        return _dumps(content)
+
+
+def model_response(
+    content: Union[BaseModel, Sequence[BaseModel]],
+    status_code: int = status.HTTP_200_OK,
+) -> DecimalORJSONResponse:
+    """Render pydantic models straight through orjson, skipping FastAPI's response re-validation."""
+    if isinstance(content, BaseModel):
+        return DecimalORJSONResponse(content.model_dump(), status_code=status_code)
+    if not content:
+        return DecimalORJSONResponse([], status_code=status_code)
+    return DecimalORJSONResponse(_list_adapter(type(content[0])).dump_python(content), status_code=status_code)
+
+
+async def stream_json_array(items: AsyncIterable[BaseModel], batch_size: int = 500) -> AsyncIterator[bytes]:
+    """Encode models as a JSON array chunk by chunk, holding at most batch_size of them in memory."""
+    separator = b"["
+    batch = []
+    async for item in items:
+        batch.append(_dumps(item.model_dump()))
+        if len(batch) >= batch_size:
+            yield separator + b",".join(batch)
+            separator = b","
+            batch = []
+
+    if batch:
+        yield separator + b",".join(batch) + b"]"
+    elif separator == b"[":
+        yield b"[]"
+    else:
+        yield b"]"
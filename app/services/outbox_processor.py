@@ -1,13 +1,14 @@
 """Processor for pending events."""
 
 import asyncio
-from datetime import datetime
+from typing import Dict, List
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db_models.accounting import OutboxEvent
+from app.models.enums import EventStatusEnumDB
 
 
 class OutboxProcessor:
@@ -23,15 +24,17 @@ class OutboxProcessor:
 
         result = await self.session.execute(
             select(OutboxEvent)
-            .where(OutboxEvent.status == "PENDING")
-            .order_by(OutboxEvent.created_at)
+            .where(OutboxEvent.status == EventStatusEnumDB.PENDING)
+            .order_by(OutboxEvent.created)
             .limit(batch_size)
+            .with_for_update(skip_locked=True)
         )
         events = result.scalars().all()
 
         logger.info(f"Found {len(events)} events to process.")
 
-        processed_count = 0
+        processed_ids: List[int] = []
+        failures: List[Dict] = []
 
         for event in events:
             event_logger = logger.bind(
@@ -42,10 +45,7 @@ class OutboxProcessor:
 
             try:
                 await self._publish_event(event, event_logger)
-
-                event.status = "PROCESSED"
-                event.processed_at = datetime.utcnow()
-                processed_count += 1
+                processed_ids.append(event.id)
 
                 event_logger.success("Event successfully processed and marked as PROCESSED.")
 
@@ -58,16 +58,45 @@ class OutboxProcessor:
                     exception=e,
                 )
 
-                event.status = "FAILED"
-                event.retry_count += 1
-                event.error_message = error_message
+                failures.append({"event_id": event.id, "error": error_message})
 
+        await self._mark_processed(processed_ids)
+        await self._mark_failed(failures)
         await self.session.commit()
 
+        processed_count = len(processed_ids)
+
         logger.info(f"Finished processing batch. Total processed: {processed_count}/{len(events)}")
 
         return processed_count
 
+    async def _mark_processed(self, event_ids: List[int]) -> None:
+        """Mark published events as processed with a single UPDATE."""
+        if not event_ids:
+            return
+        await self.session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(event_ids))
+            .values(status=EventStatusEnumDB.PROCESSED, processed=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _mark_failed(self, failures: List[Dict]) -> None:
+        """Mark failed events and bump their retry counters in one executemany."""
+        if not failures:
+            return
+        table = OutboxEvent.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("event_id"))
+            .values(
+                status=EventStatusEnumDB.FAILED,
+                retry_count=table.c.retry_count + 1,
+                error_message=bindparam("error"),
+            ),
+            failures,
+        )
+
     async def _publish_event(self, event: OutboxEvent, event_logger=logger):
         """Publish an event."""
         event_logger.info(f"Publishing event: {event.event_type} for {event.aggregate_type}:{event.aggregate_id}")
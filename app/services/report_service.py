@@ -1,13 +1,14 @@
 """Report Service Module."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from decimal import Decimal
-from typing import Dict, List
+from types import SimpleNamespace
+from typing import Dict, List, Union
 
 from loguru import logger
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.enums import TransactionStatusEnumDB
 from app.models.schemas.report import WeeklyReport
 from app.repositories.transaction_repository import TransactionRepository
 from app.repositories.user_repository import UserRepository
@@ -29,6 +30,16 @@ class ReportService:
         "USDT": Decimal("0.9709"),
     }
 
+    EMPTY_WEEK_SUMMARY = SimpleNamespace(
+        users_with_deposits_count=0,
+        users_with_posted_deposits_count=0,
+        users_with_posted_withdrawals_count=0,
+        total_transactions_count=0,
+        posted_transactions_count=0,
+        deposits_usd=None,
+        withdrawals_usd=None,
+    )
+
     def __init__(self, session: AsyncSession):
         """Initialize ReportService with an AsyncSession."""
         self.session = session
@@ -39,99 +50,70 @@ class ReportService:
         """Generate weekly transaction analysis report for the last N weeks (by default : 52)."""
         logger.info(f"Starting weekly report generation for last {weeks} weeks.")
 
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=6)
-
-        reports = []
-        weeks_with_activity = 0
+        if weeks <= 0:
+            return []
 
-        for i in range(weeks):
-            week_start_str = start_date.date().isoformat()
-            week_end_str = end_date.date().isoformat()
+        boundaries = self._week_boundaries(weeks)
+        registered_counts = await self.user_repository.count_registered_by_week(boundaries)
+        summaries = {
+            row.week: row
+            for row in await self.transaction_repository.get_weekly_summaries(boundaries, self.EXCHANGE_RATES_TO_USD)
+        }
 
-            report_logger = logger.bind(week_number=i + 1, start_date=week_start_str, end_date=week_end_str)
-            report_logger.debug(
-                f"Generating report for week {i + 1}/{weeks}. Period: {week_start_str} - {week_end_str}"
+        reports = []
+        for week in range(weeks):
+            start_date, end_date = boundaries[week + 1], boundaries[week] - timedelta(days=1)
+            report_logger = logger.bind(
+                week_number=week + 1,
+                start_date=start_date.date().isoformat(),
+                end_date=end_date.date().isoformat(),
             )
 
-            report = await self._generate_weekly_report(start_date, end_date)
+            report = self._build_weekly_report(
+                start_date,
+                end_date,
+                registered_counts.get(week, 0),
+                summaries.get(week, self.EMPTY_WEEK_SUMMARY),
+            )
 
             if self._has_activity(report):
                 reports.append(report)
-                weeks_with_activity += 1
                 report_logger.info("Report generated with activity.")
             else:
                 report_logger.debug("Report generated, but no activity found. Skipping.")
 
-            end_date = start_date - timedelta(days=7)
-            start_date -= timedelta(days=7)
-
-        logger.info(f"Finished weekly report generation. Found {weeks_with_activity} weeks with activity.")
+        logger.info(f"Finished weekly report generation. Found {len(reports)} weeks with activity.")
         return reports
 
-    async def _generate_weekly_report(self, start_date: datetime, end_date: datetime) -> Dict:
-        """Protected method to generate a weekly report."""
-        registered_users = await self.user_repository.get_registered_in_period(start_date, end_date)
-        registered_users_count = len(registered_users)
-        user_ids = [user.id for user in registered_users]
-
-        deposits_all = await self.transaction_repository.get_transactions_in_period(
-            start_date,
-            end_date,
-            amount_condition="positive",
-        )
-
-        deposits_posted = await self.transaction_repository.get_transactions_in_period(
-            start_date=start_date,
-            end_date=end_date,
-            status=TransactionStatusEnumDB.POSTED,
-            amount_condition="positive",
-        )
-
-        withdrawals_posted = await self.transaction_repository.get_transactions_in_period(
-            start_date=start_date,
-            end_date=end_date,
-            status=TransactionStatusEnumDB.POSTED,
-            amount_condition="negative",
-        )
-
-        all_transactions = await self.transaction_repository.get_transactions_in_period(
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        posted_transactions = await self.transaction_repository.get_transactions_in_period(
-            start_date=start_date,
-            end_date=end_date,
-            status=TransactionStatusEnumDB.POSTED,
-        )
-
-        users_with_deposits_all = len(set(t.user_id for t in deposits_all if t.user_id in user_ids))
-        users_with_deposits_posted = len(set(t.user_id for t in deposits_posted if t.user_id in user_ids))
-        users_with_withdrawals_posted = len(set(t.user_id for t in withdrawals_posted if t.user_id in user_ids))
-
-        total_deposits_usd = sum(self._convert_to_usd(t.amount, str(t.currency)) for t in deposits_posted)
-        total_withdrawals_usd = abs(sum(self._convert_to_usd(t.amount, str(t.currency)) for t in withdrawals_posted))
-
+    @staticmethod
+    def _week_boundaries(weeks: int) -> List[datetime]:
+        """Midnight boundaries of the last N seven-day weeks ending today, from newest to oldest."""
+        tomorrow = datetime.combine(datetime.utcnow().date() + timedelta(days=1), time.min)
+        return [tomorrow - timedelta(weeks=week) for week in range(weeks + 1)]
+
+    def _build_weekly_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        registered_users_count: int,
+        summary: Union[Row, SimpleNamespace],
+    ) -> Dict:
+        """Protected method to build a weekly report from the aggregated figures of one week."""
         return WeeklyReport(
             start_date=start_date.date(),
             end_date=end_date.date(),
             registered_users_count=registered_users_count,
-            users_with_deposits_count=users_with_deposits_all,
-            users_with_posted_deposits_count=users_with_deposits_posted,
-            users_with_posted_withdrawals_count=users_with_withdrawals_posted,
-            total_deposits_usd=total_deposits_usd,
-            total_withdrawals_usd=total_withdrawals_usd,
-            total_transactions_count=len(all_transactions),
-            posted_transactions_count=len(posted_transactions),
+            users_with_deposits_count=summary.users_with_deposits_count,
+            users_with_posted_deposits_count=summary.users_with_posted_deposits_count,
+            users_with_posted_withdrawals_count=summary.users_with_posted_withdrawals_count,
+            total_deposits_usd=summary.deposits_usd or Decimal("0"),
+            total_withdrawals_usd=abs(summary.withdrawals_usd or Decimal("0")),
+            total_transactions_count=summary.total_transactions_count,
+            posted_transactions_count=summary.posted_transactions_count,
         ).model_dump()
 
-    def _convert_to_usd(self, amount: Decimal, currency: str) -> Decimal:
-        """Protected method to convert an amount to USD."""
-        rate = self.EXCHANGE_RATES_TO_USD.get(currency, Decimal("1.0"))
-        return amount * rate
-
-    def _has_activity(self, report: Dict) -> bool:
+    @staticmethod
+    def _has_activity(report: Dict) -> bool:
         """Check if report has any activity."""
         return any(
             [
@@ -1,12 +1,13 @@
 """Transaction service module."""
 
 from decimal import Decimal
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import (
+    BalanceNotFoundException,
     NegativeBalanceException,
     TransactionAlreadyRollbackedException,
     TransactionDoesNotBelongToUserException,
@@ -14,7 +15,7 @@ from app.exceptions import (
     UserBlockedException,
     UserNotExistsException,
 )
-from app.models.enums import TransactionStatusEnumDB, UserStatusEnumDB
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB, UserStatusEnumDB
 from app.models.schemas.transaction import RequestTransactionModel, TransactionModel
 from app.repositories.balance_repository import BalanceRepository
 from app.repositories.transaction_repository import TransactionRepository
@@ -52,7 +53,7 @@ class TransactionService:
             logger.warning("Blocked user attempted transaction creation", user_id=user_id)
             raise UserBlockedException(user_id, "create transaction")
 
-        balance = await self.balance_repository.get_by_user_and_currency(user_id, transaction_data.currency)
+        balance = next((b for b in user.balances if b.currency == transaction_data.currency), None)
 
         if balance is None:
             logger.error(
@@ -60,7 +61,7 @@ class TransactionService:
                 user_id=user_id,
                 currency=str(transaction_data.currency),
             )
-            raise ValueError(f"Balance not found for currency {transaction_data.currency}")
+            raise BalanceNotFoundException(user_id, str(transaction_data.currency))
 
         new_balance = balance.amount + transaction_data.amount
         if new_balance < 0:
@@ -77,7 +78,7 @@ class TransactionService:
             )
 
         async with self.transaction_repository.transaction():
-            await self.balance_repository.update_balance(
+            new_balance = await self.balance_repository.update_balance(
                 user_id=user_id,
                 currency=transaction_data.currency,
                 amount_delta=transaction_data.amount,
@@ -106,26 +107,42 @@ class TransactionService:
             created=transaction.created,
         )
 
+    async def bulk_create(
+        self,
+        records: List[Tuple[int, CurrencyEnumDB, Decimal, TransactionStatusEnumDB]],
+    ) -> int:
+        """Bulk import raw transaction records. Balances and the ledger are not touched."""
+        logger.info("Bulk importing transactions", count=len(records))
+
+        async with self.transaction_repository.transaction():
+            inserted = await self.transaction_repository.bulk_insert(records)
+
+        logger.success("Transactions bulk imported", count=inserted)
+        return inserted
+
     async def get_transactions(
         self,
         user_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        before_id: Optional[int] = None,
     ) -> List[TransactionModel]:
         """Get transactions with optional user filter."""
-        logger.info("Fetching transactions", user_id=user_id, skip=skip, limit=limit)
+        logger.info("Fetching transactions", user_id=user_id, skip=skip, limit=limit, before_id=before_id)
 
         if user_id is not None:
             transactions = await self.transaction_repository.get_user_transactions(
-                user_id=user_id, skip=skip, limit=limit
+                user_id=user_id, skip=skip, limit=limit, before_id=before_id
             )
         else:
-            transactions = await self.transaction_repository.get_all_transactions(skip=skip, limit=limit)
+            transactions = await self.transaction_repository.get_all_transactions(
+                skip=skip, limit=limit, before_id=before_id
+            )
 
         logger.info(f"Found {len(transactions)} transactions")
 
         return [
-            TransactionModel(
+            TransactionModel.model_construct(
                 id=t.id,
                 user_id=t.user_id,
                 currency=t.currency,
@@ -136,6 +153,20 @@ class TransactionService:
             for t in transactions
         ]
 
+    async def stream_transactions(self, user_id: Optional[int] = None) -> AsyncIterator[TransactionModel]:
+        """Stream transactions with optional user filter without loading them all at once."""
+        logger.info("Streaming transactions", user_id=user_id)
+
+        async for t in self.transaction_repository.stream_transactions(user_id=user_id):
+            yield TransactionModel.model_construct(
+                id=t.id,
+                user_id=t.user_id,
+                currency=t.currency,
+                amount=t.amount,
+                status=t.status,
+                created=t.created,
+            )
+
     async def rollback_transaction(
         self,
         user_id: int,
@@ -148,16 +179,17 @@ class TransactionService:
             transaction_id=transaction_id,
         )
 
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
+        context = await self.transaction_repository.get_rollback_context(user_id, transaction_id)
+        if not context:
             logger.warning("User not found for rollback", user_id=user_id)
             raise UserNotExistsException(user_id)
 
+        user, transaction = context
+
         if user.status.name == UserStatusEnumDB.BLOCKED:
             logger.warning("Blocked user attempted rollback", user_id=user_id)
             raise UserBlockedException(user_id, "rollback transaction")
 
-        transaction = await self.transaction_repository.get_by_id_with_entries(transaction_id)
         if not transaction:
             logger.warning("Transaction not found for rollback", transaction_id=transaction_id)
             raise TransactionNotFound(transaction_id)
@@ -177,7 +209,11 @@ class TransactionService:
 
         reverse_amount = -transaction.amount
 
-        balance = await self.balance_repository.get_by_user_and_currency(user_id, transaction.currency)
+        balance = next((b for b in user.balances if b.currency == transaction.currency), None)
+        if balance is None:
+            logger.error("Balance not found", user_id=user_id, currency=str(transaction.currency))
+            raise BalanceNotFoundException(user_id, str(transaction.currency))
+
         new_balance = balance.amount + reverse_amount
 
         if new_balance < 0:
@@ -195,17 +231,19 @@ class TransactionService:
             )
 
         async with self.transaction_repository.transaction():
-            await self.balance_repository.update_balance(
+            # The conditional UPDATE is the real guard: a concurrent rollback that read the same POSTED row
+            # finds nothing to update here, so the balance is never reversed twice.
+            updated_transaction = await self.transaction_repository.reverse_if_not_reversed(transaction_id)
+            if updated_transaction is None:
+                logger.warning("Transaction already rolled back", transaction_id=transaction_id)
+                raise TransactionAlreadyRollbackedException(transaction_id)
+
+            new_balance = await self.balance_repository.update_balance(
                 user_id=user_id,
                 currency=transaction.currency,
                 amount_delta=reverse_amount,
             )
 
-            updated_transaction = await self.transaction_repository.update(
-                transaction,
-                status=TransactionStatusEnumDB.REVERSED,
-            )
-
         logger.success(
             "Transaction successfully rolled back",
             transaction_id=updated_transaction.id,
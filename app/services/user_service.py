@@ -1,6 +1,6 @@
 """User service module."""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -43,8 +43,6 @@ class UserService:
 
             balances = await self.balance_repository.create_all_currency_balances(user.id)
 
-            await self.session.refresh(user)
-
         logger.success(
             "User successfully created with initial balances",
             user_id=user.id,
@@ -56,9 +54,20 @@ class UserService:
             email=user.email,
             status=user.status,
             created=user.created,
-            balances=[{"currency": b.currency, "amount": b.amount} for b in balances],
+            balances=balances,
         )
 
+    async def bulk_create_users(self, emails: Sequence[str]) -> List[int]:
+        """Create many active users with zero balances in all currencies and return their ids."""
+        logger.info("Bulk creating users", count=len(emails))
+
+        async with self.user_repository.transaction():
+            user_ids = await self.user_repository.bulk_create(emails)
+            await self.balance_repository.create_all_currency_balances_for_users(user_ids)
+
+        logger.success("Users bulk created with initial balances", count=len(user_ids))
+        return user_ids
+
     async def get_users(
         self,
         user_id: Optional[int] = None,
@@ -84,20 +93,7 @@ class UserService:
 
         logger.info(f"Found {len(users)} users matching the criteria.")
 
-        result = []
-        for user in users:
-            balances = await self.balance_repository.get_user_balances(user.id)
-            result.append(
-                UserDetailResponse(
-                    id=user.id,
-                    email=user.email,
-                    status=user.status,
-                    created=user.created,
-                    balances=[{"currency": b.currency, "amount": b.amount} for b in balances],
-                )
-            )
-
-        return result
+        return [UserDetailResponse.model_validate(user) for user in users]
 
     async def get_user_by_id(self, user_id: int) -> UserDetailResponse:
         """Get user by ID with balances."""
@@ -108,17 +104,9 @@ class UserService:
             logger.warning("User not found by ID", user_id=user_id)
             raise UserNotExistsException(user_id)
 
-        balances = await self.balance_repository.get_user_balances(user_id)
-
         logger.debug("Successfully fetched user and balances", user_id=user_id)
 
-        return UserDetailResponse(
-            id=user.id,
-            email=user.email,
-            status=user.status,
-            created=user.created,
-            balances=[{"currency": b.currency, "amount": b.amount} for b in balances],
-        )
+        return UserDetailResponse.model_validate(user)
 
     async def update_user_status(
         self,
@@ -129,29 +117,23 @@ class UserService:
         new_status = update_data.status.name
         logger.info(f"Attempting to update user {user_id} status to {new_status}")
 
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
-            logger.warning("User not found for status update", user_id=user_id)
-            raise UserNotExistsException(user_id)
-
-        old_status = user.status.name
-
-        if old_status != new_status:
-            pass
-        elif update_data.status == UserStatusEnumDB.BLOCKED:
-            logger.warning("Status update redundant: User already blocked", user_id=user_id)
-            raise UserAlreadyBlockedException(user_id)
-        else:
+        async with self.user_repository.transaction():
+            updated_user = await self.user_repository.update_status_if_different(user_id, update_data.status)
+
+        if updated_user is None:
+            current_status = await self.user_repository.get_status(user_id)
+            if current_status is None:
+                logger.warning("User not found for status update", user_id=user_id)
+                raise UserNotExistsException(user_id)
+            if update_data.status == UserStatusEnumDB.BLOCKED:
+                logger.warning("Status update redundant: User already blocked", user_id=user_id)
+                raise UserAlreadyBlockedException(user_id)
             logger.warning("Status update redundant: User already active", user_id=user_id)
             raise UserAlreadyActiveException(user_id)
 
-        async with self.user_repository.transaction():
-            updated_user = await self.user_repository.update(user, status=update_data.status)
-
         logger.success(
             "User status successfully updated",
             user_id=user_id,
-            old_status=old_status,
             new_status=new_status,
         )
 
@@ -20,7 +20,9 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,
     task_soft_time_limit=25 * 60,
-    worker_prefetch_multiplier=4,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
 )
 
@@ -1,36 +1,69 @@
 """Celery tasks for generating reports."""
 
 import asyncio
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from celery.signals import worker_process_init, worker_process_shutdown
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.cache import cache_set, get_redis, weekly_report_cache_key
 from app.config import settings
+from app.database import connect_args
+from app.responses import DecimalORJSONResponse
 from app.services.report_service import ReportService
 from app.tasks.celery_app import celery_app
 
+# A prefork worker process runs one task at a time, so a small pool kept warm between tasks is enough.
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=settings.celery_db_pool_size,
+    max_overflow=settings.celery_db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args=connect_args,
+)
+async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-async def generate_report(weeks: int) -> List[Dict]:
-    """Generate weekly report asynchronously."""
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker process event loop, which pooled connections stay bound to between tasks."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
 
+
+async def generate_report(weeks: int) -> List[Dict]:
+    """Generate weekly report asynchronously and store it under the key the sync endpoint reads."""
     async with async_session_maker() as session:
         report_service = ReportService(session)
         report = await report_service.generate_weekly_report(weeks=weeks)
 
-    await engine.dispose()
+    payload = DecimalORJSONResponse(report).body
+    await cache_set(await get_redis(), weekly_report_cache_key(weeks), payload, settings.weekly_report_cache_ttl)
     return report
 
 
 @celery_app.task(name="generate_weekly_report", bind=True, ignore_result=True)
 def generate_weekly_report_task(self, weeks: int = 52) -> List[Dict]:
     """Celery task to generate weekly report."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    result = loop.run_until_complete(generate_report(weeks))
-    return result
+    return _get_event_loop().run_until_complete(generate_report(weeks))
+
+
+@worker_process_init.connect
+def init_event_loop(**kwargs) -> None:
+    """Create the event loop once per worker process, after the fork."""
+    _get_event_loop()
+
+
+@worker_process_shutdown.connect
+def dispose_engine(**kwargs) -> None:
+    """Close pooled connections and the event loop once when the worker process exits."""
+    loop = _get_event_loop()
+    loop.run_until_complete(engine.dispose())
+    loop.close()
@@ -2,104 +2,101 @@
 
 import asyncio
 import random
+from collections import defaultdict
 from decimal import Decimal
+from typing import Dict, List, Tuple
 
 from faker import Faker
 from loguru import logger
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.config import settings
-from app.models.enums import CurrencyEnumDB
-from app.models.schemas.transaction import RequestTransactionModel
-from app.models.schemas.user import UserCreateRequest
+from app.database import connect_args
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
+from app.repositories.balance_repository import BalanceRepository
 from app.services.transaction_service import TransactionService
 from app.services.user_service import UserService
 
 fake = Faker()
 
+# The script runs one session at a time, so a single pooled connection is enough.
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=True,
+    connect_args=connect_args,
+)
+async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
-async def seed_database(num_users: int = 10, num_transactions_per_user: int = 5) -> None:
+CURRENCIES = list(CurrencyEnumDB)
+
+# Children first, so the DELETE fallback never trips a foreign key.
+CLEAR_TABLES = ("journal_entries", "outbox_events", "transactions", "user_balances", "users", "accounts")
+
+
+def random_amount(low: Decimal, high: Decimal) -> Decimal:
+    """Pick a random amount with cent precision between low and high inclusive."""
+    return Decimal(random.randint(int(low * 100), int(high * 100))).scaleb(-2)
+
+
+async def seed_database(num_users: int = 10, num_transactions_per_user: int = 5, batch_size: int = 1000) -> None:
     """Seed database with test users and transactions."""
     logger.info(f"Starting database seeding: {num_users} users, {num_transactions_per_user} transactions each")
 
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
-
     async with async_session_maker() as session:
         user_service = UserService(session)
         transaction_service = TransactionService(session)
-
-        created_users = []
+        balance_repository = BalanceRepository(session)
 
         logger.info(f"Creating {num_users} users...")
-        for i in range(num_users):
-            try:
-                email = fake.unique.email()
-                user = await user_service.create_user(UserCreateRequest(email=email))
-                created_users.append(user)
-                logger.debug(f"Created user {i + 1}/{num_users}: {email} (ID: {user.id})")
-            except Exception as e:
-                logger.error(f"Failed to create user {i + 1}: {e}")
+        emails = [fake.unique.email() for _ in range(num_users)]
+        user_ids: List[int] = []
+        for start in range(0, num_users, batch_size):
+            user_ids.extend(await user_service.bulk_create_users(emails[start : start + batch_size]))
 
-        logger.success(f"Successfully created {len(created_users)} users")
+        logger.success(f"Successfully created {len(user_ids)} users")
 
         logger.info("Creating transactions...")
-        total_transactions = 0
-
-        for user in created_users:
-            user_transactions = 0
+        # Balances are mirrored locally so withdrawals never need a read round trip.
+        balances: Dict[Tuple[int, CurrencyEnumDB], Decimal] = defaultdict(Decimal)
+        records = []
 
+        for user_id in user_ids:
             for _ in range(num_transactions_per_user):
-                try:
-                    currency = random.choice(list(CurrencyEnumDB))
-
-                    is_deposit = random.random() < 0.7
-
-                    if is_deposit:
-                        amount = Decimal(str(round(random.uniform(10, 1000), 2)))
-                    else:
-                        user_detail = await user_service.get_user_by_id(user.id)
-                        balance = next(
-                            (b.amount for b in user_detail.balances if b.currency == currency),
-                            Decimal(0),
-                        )
-
-                        if balance > 0:
-                            max_withdrawal = min(balance, Decimal("500"))
-                            amount = -Decimal(str(round(random.uniform(1, float(max_withdrawal)), 2)))
-                        else:
-                            amount = Decimal(str(round(random.uniform(10, 500), 2)))
-
-                    transaction = await transaction_service.create_transaction(
-                        user_id=user.id,
-                        transaction_data=RequestTransactionModel(currency=currency, amount=amount),
-                    )
-
-                    user_transactions += 1
-                    total_transactions += 1
-
-                    if random.random() < 0.1:
-                        try:
-                            await transaction_service.rollback_transaction(user.id, transaction.id)
-                            logger.debug(f"Rolled back transaction {transaction.id}")
-                        except Exception as e:
-                            logger.debug(f"Could not rollback transaction {transaction.id}: {e}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to create transaction for user {user.id}: {e}")
-
-            logger.debug(f"Created {user_transactions} transactions for user {user.id}")
+                currency = random.choice(CURRENCIES)
+                balance = balances[(user_id, currency)]
 
+                is_deposit = random.random() < 0.7
+
+                if is_deposit or balance < 1:
+                    amount = random_amount(Decimal("10"), Decimal("1000") if is_deposit else Decimal("500"))
+                else:
+                    amount = -random_amount(Decimal("1"), min(balance, Decimal("500")))
+
+                if random.random() < 0.1:
+                    # A rollback right after creation leaves the balance where it was.
+                    records.append((user_id, currency, amount, TransactionStatusEnumDB.REVERSED))
+                else:
+                    records.append((user_id, currency, amount, TransactionStatusEnumDB.POSTED))
+                    balances[(user_id, currency)] = balance + amount
+
+        for start in range(0, len(records), batch_size):
+            await transaction_service.bulk_create(records[start : start + batch_size])
+
+        async with balance_repository.transaction():
+            await balance_repository.set_amounts(balances)
+
+        total_transactions = len(records)
         logger.success(f"Successfully created {total_transactions} transactions")
 
         logger.info("=== Database Seeding Summary ===")
-        logger.info(f"Users created: {len(created_users)}")
+        logger.info(f"Users created: {len(user_ids)}")
         logger.info(f"Transactions created: {total_transactions}")
-        logger.info(
-            f"Average transactions per user: {total_transactions / len(created_users) if created_users else 0:.2f}"
-        )
+        logger.info(f"Average transactions per user: {total_transactions / len(user_ids) if user_ids else 0:.2f}")
 
-    await engine.dispose()
     logger.success("Database seeding completed successfully!")
 
 
@@ -107,17 +104,13 @@ async def clear_database() -> None:
     """Clear all data from database (for testing purposes)."""
     logger.warning("Clearing database...")
 
-    engine = create_async_engine(settings.database_url, echo=False)
-
     async with engine.begin() as conn:
-        await conn.execute("DELETE FROM journal_entries")
-        await conn.execute("DELETE FROM outbox_events")
-        await conn.execute("DELETE FROM transactions")
-        await conn.execute("DELETE FROM user_balances")
-        await conn.execute("DELETE FROM users")
-        await conn.execute("DELETE FROM accounts")
-
-    await engine.dispose()
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text(f"TRUNCATE TABLE {', '.join(CLEAR_TABLES)} RESTART IDENTITY CASCADE"))
+        else:
+            for table in CLEAR_TABLES:
+                await conn.execute(text(f"DELETE FROM {table}"))
+
     logger.success("Database cleared successfully!")
 
 
@@ -125,14 +118,17 @@ async def main() -> None:
     """Run the script."""
     import sys
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
-        await clear_database()
-        return
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+            await clear_database()
+            return
 
-    num_users = int(sys.argv[1]) if len(sys.argv) > 1 else 10
-    num_transactions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+        num_users = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+        num_transactions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
 
-    await seed_database(num_users=num_users, num_transactions_per_user=num_transactions)
+        await seed_database(num_users=num_users, num_transactions_per_user=num_transactions)
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
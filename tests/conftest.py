@@ -1,18 +1,32 @@
 """Test fixtures and configuration."""
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import AsyncGenerator, Callable, ContextManager, Generator, Iterator, List
 
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_async_session
+from app.cache import get_redis
+from app.database import Base, get_async_session, get_read_session, get_session_maker
 from app.main import app
 from app.models.db_models import *  # noqa: F401, F403
-
+from app.models.db_models.transaction import Transaction
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB, UserStatusEnumDB
+from app.models.schemas.user import UserUpdateRequest
+from app.services.report_service import ReportService
+from app.services.transaction_service import TransactionService
+from app.services.user_service import UserService
+from tests.fakes import FailingRedis, FakeRedis
+
+# An in-memory database lives in its own process, so each pytest-xdist worker gets a private one.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 test_engine = create_async_engine(
@@ -22,13 +36,36 @@ test_engine = create_async_engine(
     echo=False,
 )
 
-TestSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+_TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK")
+
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record) -> None:
+    """Stop the sqlite driver from managing transactions so SAVEPOINTs behave."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn) -> None:
+    """Emit BEGIN ourselves now that the driver no longer does."""
+    conn.exec_driver_sql("BEGIN")
+
+
+@contextmanager
+def _count_queries() -> Iterator[List[str]]:
+    """Collect the SQL statements sent to the test database inside the block, minus transaction control."""
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.startswith(_TRANSACTION_CONTROL):
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
 
 
 @pytest.fixture(scope="session")
@@ -39,22 +76,115 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
-@pytest.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
+@pytest.fixture(scope="session", autouse=True)
+async def _init_schema() -> AsyncGenerator[None, None]:
+    """Create the schema once for the whole test run."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with TestSessionLocal() as session:
-        yield session
-        await session.rollback()
+    yield
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
 @pytest.fixture(scope="function")
-def client(db_session: AsyncSession) -> Generator[TestClient, None, None]:
+async def session_maker() -> AsyncGenerator[async_sessionmaker, None]:
+    """Bind sessions to one connection whose outer transaction is rolled back after the test."""
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+
+        yield async_sessionmaker(
+            bind=connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+async def db_session(session_maker: async_sessionmaker) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session; its commits only release savepoints."""
+    async with session_maker() as session:
+        yield session
+
+
+@pytest.fixture(scope="function")
+def services(db_session: AsyncSession) -> SimpleNamespace:
+    """Build the user, transaction and report services over the test session once per test."""
+    return SimpleNamespace(
+        user=UserService(db_session),
+        tx=TransactionService(db_session),
+        report=ReportService(db_session),
+    )
+
+
+@pytest.fixture(scope="function")
+async def user_ids(session_maker: async_sessionmaker) -> List[int]:
+    """Bulk-create a few active users with zero balances, skipping the HTTP round trip per user."""
+    async with session_maker() as session:
+        return await UserService(session).bulk_create_users([f"pool_user{i}@example.com" for i in range(3)])
+
+
+@pytest.fixture(scope="function")
+async def blocked_user_id(session_maker: async_sessionmaker, user_ids: List[int]) -> int:
+    """Block the last fixture user at the service level and return its id."""
+    async with session_maker() as session:
+        await UserService(session).update_user_status(user_ids[-1], UserUpdateRequest(status=UserStatusEnumDB.BLOCKED))
+    return user_ids[-1]
+
+
+@pytest.fixture(scope="function")
+async def many_transactions(session_maker: async_sessionmaker, user_ids: List[int]) -> int:
+    """Bulk-insert posted USD deposits for the first fixture user and return how many were inserted."""
+    records = [(user_ids[0], CurrencyEnumDB.USD, Decimal("10"), TransactionStatusEnumDB.POSTED) for _ in range(5)]
+    async with session_maker() as session:
+        return await TransactionService(session).bulk_create(records)
+
+
+@pytest.fixture(scope="function")
+async def shuffled_transactions(session_maker: async_sessionmaker, user_ids: List[int]) -> List[int]:
+    """Insert transactions whose created order differs from id order; return their ids newest first."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        {
+            "user_id": user_ids[0],
+            "currency": CurrencyEnumDB.USD,
+            "amount": Decimal("10"),
+            "status": TransactionStatusEnumDB.POSTED,
+            "created": base + timedelta(minutes=minutes),
+        }
+        for minutes in (3, 1, 4, 2)
+    ]
+    async with session_maker() as session:
+        result = await session.execute(
+            insert(Transaction).returning(Transaction.id, Transaction.created, sort_by_parameter_order=True), rows
+        )
+        created_by_id = dict(result.all())
+        await session.commit()
+    return sorted(created_by_id, key=lambda tx_id: (created_by_id[tx_id], tx_id), reverse=True)
+
+
+@pytest.fixture(scope="function")
+def count_queries() -> Callable[[], ContextManager[List[str]]]:
+    """Provide a context manager that records the queries run inside it, to pin down N+1 regressions."""
+    return _count_queries
+
+
+@pytest.fixture(scope="session")
+def _test_client() -> Generator[TestClient, None, None]:
+    """Start the app once and share a single test client across the session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(
+    _test_client: TestClient, db_session: AsyncSession, session_maker: async_sessionmaker
+) -> Generator[TestClient, None, None]:
     """Create a test client with overridden database session."""
 
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -62,15 +192,35 @@ def client(db_session: AsyncSession) -> Generator[TestClient, None, None]:
         yield db_session
 
     app.dependency_overrides[get_async_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    app.dependency_overrides[get_session_maker] = lambda: session_maker
+    app.dependency_overrides[get_redis] = lambda: None
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _test_client
 
     app.dependency_overrides.clear()
 
 
 @pytest.fixture(scope="function")
-async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+def fake_redis(client: TestClient) -> FakeRedis:
+    """Serve the client's cache from an in-memory fake instead of disabling it."""
+    redis = FakeRedis()
+    app.dependency_overrides[get_redis] = lambda: redis
+    return redis
+
+
+@pytest.fixture(scope="function")
+def failing_redis(client: TestClient) -> FailingRedis:
+    """Make every cache call of the client fail."""
+    redis = FailingRedis()
+    app.dependency_overrides[get_redis] = lambda: redis
+    return redis
+
+
+@pytest.fixture(scope="function")
+async def async_client(
+    db_session: AsyncSession, session_maker: async_sessionmaker
+) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client with overridden database session."""
 
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -78,6 +228,9 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
         yield db_session
 
     app.dependency_overrides[get_async_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
+    app.dependency_overrides[get_session_maker] = lambda: session_maker
+    app.dependency_overrides[get_redis] = lambda: None
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,42 @@
+"""In-memory stand-ins for external services used by the tests."""
+
+from typing import Dict, Optional
+
+from redis.exceptions import RedisError
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis calls the cache layer makes."""
+
+    def __init__(self) -> None:
+        """Start with an empty store."""
+        self.store: Dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the stored payload, if any."""
+        return self.store.get(key)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        """Store the payload; the TTL is ignored."""
+        self.store[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        """Drop the given keys."""
+        for key in keys:
+            self.store.pop(key, None)
+
+
+class FailingRedis:
+    """Redis client whose every call fails, as when the server is down."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Fail the read."""
+        raise RedisError("connection refused")
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        """Fail the write."""
+        raise RedisError("connection refused")
+
+    async def delete(self, *keys: str) -> None:
+        """Fail the invalidation."""
+        raise RedisError("connection refused")
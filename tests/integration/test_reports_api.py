@@ -1,10 +1,14 @@
 """Integration tests for Reports API endpoints."""
 
 from decimal import Decimal
+from typing import Callable
 
 from fastapi.testclient import TestClient
 
+from app.api.reports import MAX_BULK_REPORTS, MAX_REPORT_WEEKS
+from app.cache import weekly_report_cache_key
 from app.models.enums import CurrencyEnumDB
+from tests.fakes import FakeRedis
 
 
 class TestReportsAPI:
@@ -18,7 +22,7 @@ class TestReportsAPI:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_get_weekly_report_with_transactions(self, client: TestClient) -> None:
+    def test_get_weekly_report_with_transactions(self, client: TestClient, count_queries: Callable) -> None:
         """Test getting weekly report with transactions."""
         user_response = client.post("/users", json={"email": "report_user@example.com"})
         user_id = user_response.json()["id"]
@@ -32,7 +36,10 @@ class TestReportsAPI:
             json={"currency": CurrencyEnumDB.EUR, "amount": str(Decimal(50))},
         )
 
-        response = client.get("/reports/weekly?weeks=1")
+        with count_queries() as queries:
+            response = client.get("/reports/weekly?weeks=1")
+
+        assert len(queries) == 2
 
         assert response.status_code == 200
         data = response.json()
@@ -46,6 +53,27 @@ class TestReportsAPI:
         data = response.json()
         assert isinstance(data, list)
 
+    def test_get_weekly_report_served_from_cache(
+        self, client: TestClient, fake_redis: FakeRedis, count_queries: Callable
+    ) -> None:
+        """Test that a repeated weekly report request is answered from the cache without touching the database."""
+        first = client.get("/reports/weekly?weeks=1")
+
+        with count_queries() as queries:
+            second = client.get("/reports/weekly?weeks=1")
+
+        assert len(queries) == 0
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert weekly_report_cache_key(1) in fake_redis.store
+
+    def test_generate_weekly_reports_bulk_rejects_out_of_range_weeks(self, client: TestClient) -> None:
+        """Test the bulk endpoint rejects oversized batches and week counts outside the allowed range."""
+        for weeks in ([], [0], [MAX_REPORT_WEEKS + 1], [1] * (MAX_BULK_REPORTS + 1)):
+            response = client.post("/reports/weekly/async/bulk", json={"weeks": weeks})
+
+            assert response.status_code == 422
+
     def test_health_check(self, client: TestClient) -> None:
         """Test health check endpoint."""
         response = client.get("/")
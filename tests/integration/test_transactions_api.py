@@ -1,10 +1,14 @@
 """Integration tests for Transactions API endpoints."""
 
 from decimal import Decimal
+from typing import List
 
 from fastapi.testclient import TestClient
 
-from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB, UserStatusEnumDB
+from app.cache import user_cache_key
+from app.models.db_models.types import MAX_AMOUNT
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
+from tests.fakes import FakeRedis
 
 
 class TestTransactionsAPI:
@@ -27,10 +31,9 @@ class TestTransactionsAPI:
         assert Decimal(data["amount"]) == Decimal("100.50")
         assert data["status"] == TransactionStatusEnumDB.POSTED
 
-    def test_create_withdrawal_transaction_success(self, client: TestClient) -> None:
+    def test_create_withdrawal_transaction_success(self, client: TestClient, user_ids: List[int]) -> None:
         """Test successful withdrawal transaction creation via API."""
-        user_response = client.post("/users", json={"email": "withdraw_api@example.com"})
-        user_id = user_response.json()["id"]
+        user_id = user_ids[0]
 
         client.post(
             f"/transactions/users/{user_id}",
@@ -55,24 +58,19 @@ class TestTransactionsAPI:
 
         assert response.status_code == 404
 
-    def test_create_transaction_user_blocked(self, client: TestClient) -> None:
+    def test_create_transaction_user_blocked(self, client: TestClient, blocked_user_id: int) -> None:
         """Test creating transaction for blocked user returns 403."""
-        user_response = client.post("/users", json={"email": "blocked_transaction@example.com"})
-        user_id = user_response.json()["id"]
-        client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
-
         response = client.post(
-            f"/transactions/users/{user_id}",
+            f"/transactions/users/{blocked_user_id}",
             json={"currency": CurrencyEnumDB.USD, "amount": str(Decimal("100"))},
         )
 
         assert response.status_code == 403
         assert "blocked" in response.json()["detail"].lower()
 
-    def test_create_transaction_negative_balance(self, client: TestClient) -> None:
+    def test_create_transaction_negative_balance(self, client: TestClient, user_ids: List[int]) -> None:
         """Test creating transaction that would result in negative balance returns 400."""
-        user_response = client.post("/users", json={"email": "negative_balance@example.com"})
-        user_id = user_response.json()["id"]
+        user_id = user_ids[0]
 
         response = client.post(
             f"/transactions/users/{user_id}",
@@ -82,17 +80,28 @@ class TestTransactionsAPI:
         assert response.status_code == 400
         assert "insufficient" in response.json()["detail"].lower() or "balance" in response.json()["detail"].lower()
 
-    def test_get_transactions_all(self, client: TestClient) -> None:
+    def test_create_transaction_amount_out_of_range(self, client: TestClient, user_ids: List[int]) -> None:
+        """Test amounts whose minor units do not fit in BIGINT are rejected with 422."""
+        user_id = user_ids[0]
+
+        for amount in (MAX_AMOUNT, -MAX_AMOUNT, Decimal("1e20")):
+            response = client.post(
+                f"/transactions/users/{user_id}",
+                json={"currency": CurrencyEnumDB.USD, "amount": str(amount)},
+            )
+
+            assert response.status_code == 422
+
+    def test_get_transactions_all(self, client: TestClient, user_ids: List[int]) -> None:
         """Test getting all transactions."""
-        user1_response = client.post("/users", json={"email": "user1_tx@example.com"})
-        user2_response = client.post("/users", json={"email": "user2_tx@example.com"})
+        user1_id, user2_id = user_ids[:2]
 
         client.post(
-            f"/transactions/users/{user1_response.json()['id']}",
+            f"/transactions/users/{user1_id}",
             json={"currency": CurrencyEnumDB.USD, "amount": str(Decimal("100"))},
         )
         client.post(
-            f"/transactions/users/{user2_response.json()['id']}",
+            f"/transactions/users/{user2_id}",
             json={"currency": CurrencyEnumDB.EUR, "amount": str(Decimal("50"))},
         )
 
@@ -101,15 +110,11 @@ class TestTransactionsAPI:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 2
+        assert len(data) == 2
 
-    def test_get_transactions_filter_by_user(self, client: TestClient) -> None:
+    def test_get_transactions_filter_by_user(self, client: TestClient, user_ids: List[int]) -> None:
         """Test getting transactions filtered by user."""
-        user1_response = client.post("/users", json={"email": "filter_user1@example.com"})
-        user2_response = client.post("/users", json={"email": "filter_user2@example.com"})
-
-        user1_id = user1_response.json()["id"]
-        user2_id = user2_response.json()["id"]
+        user1_id, user2_id = user_ids[:2]
 
         client.post(
             f"/transactions/users/{user1_id}",
@@ -126,27 +131,54 @@ class TestTransactionsAPI:
         data = response.json()
         assert all(tx["user_id"] == user1_id for tx in data)
 
-    def test_get_transactions_pagination(self, client: TestClient) -> None:
+    def test_get_transactions_pagination(self, client: TestClient, many_transactions: int) -> None:
         """Test getting transactions with pagination."""
-        user_response = client.post("/users", json={"email": "pagination@example.com"})
-        user_id = user_response.json()["id"]
+        response = client.get("/transactions?skip=0&limit=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
 
-        for i in range(5):
+    def test_get_transactions_keyset_pagination(self, client: TestClient, shuffled_transactions: List[int]) -> None:
+        """Test that keyset pages follow the offset ordering and together cover every transaction once."""
+        first_page = client.get("/transactions?limit=2").json()
+        seen = [tx["id"] for tx in first_page]
+
+        while True:
+            response = client.get(f"/transactions?limit=2&before_id={seen[-1]}")
+            assert response.status_code == 200
+            page = [tx["id"] for tx in response.json()]
+            if not page:
+                break
+            seen.extend(page)
+
+        assert seen == shuffled_transactions
+        assert [tx["id"] for tx in client.get("/transactions?limit=10").json()] == shuffled_transactions
+
+    def test_export_transactions_filter_by_user(self, client: TestClient, user_ids: List[int]) -> None:
+        """Test streaming the transaction export filtered by user."""
+        user1_id, user2_id = user_ids[:2]
+
+        for _ in range(3):
             client.post(
-                f"/transactions/users/{user_id}",
+                f"/transactions/users/{user1_id}",
                 json={"currency": CurrencyEnumDB.USD, "amount": str(Decimal("10"))},
             )
+        client.post(
+            f"/transactions/users/{user2_id}",
+            json={"currency": CurrencyEnumDB.EUR, "amount": str(Decimal("50"))},
+        )
 
-        response = client.get("/transactions?skip=0&limit=2")
+        response = client.get(f"/transactions/export?user_id={user1_id}")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) <= 2
+        assert len(data) == 3
+        assert all(tx["user_id"] == user1_id for tx in data)
 
-    def test_rollback_transaction_success(self, client: TestClient) -> None:
+    def test_rollback_transaction_success(self, client: TestClient, user_ids: List[int]) -> None:
         """Test successful transaction rollback via API."""
-        user_response = client.post("/users", json={"email": "rollback_api@example.com"})
-        user_id = user_response.json()["id"]
+        user_id = user_ids[0]
 
         tx_response = client.post(
             f"/transactions/users/{user_id}",
@@ -167,22 +199,17 @@ class TestTransactionsAPI:
 
         assert response.status_code == 404
 
-    def test_rollback_transaction_not_found(self, client: TestClient) -> None:
+    def test_rollback_transaction_not_found(self, client: TestClient, user_ids: List[int]) -> None:
         """Test rolling back non-existent transaction returns 404."""
-        user_response = client.post("/users", json={"email": "notfound_rollback@example.com"})
-        user_id = user_response.json()["id"]
+        user_id = user_ids[0]
 
         response = client.patch(f"/transactions/users/{user_id}/transactions/99999/rollback")
 
         assert response.status_code == 404
 
-    def test_rollback_transaction_wrong_user(self, client: TestClient) -> None:
+    def test_rollback_transaction_wrong_user(self, client: TestClient, user_ids: List[int]) -> None:
         """Test rolling back transaction that doesn't belong to user returns 403."""
-        user1_response = client.post("/users", json={"email": "user1_rollback@example.com"})
-        user2_response = client.post("/users", json={"email": "user2_rollback@example.com"})
-
-        user1_id = user1_response.json()["id"]
-        user2_id = user2_response.json()["id"]
+        user1_id, user2_id = user_ids[:2]
 
         tx_response = client.post(
             f"/transactions/users/{user1_id}",
@@ -194,10 +221,9 @@ class TestTransactionsAPI:
 
         assert response.status_code == 403
 
-    def test_rollback_transaction_already_rollbacked(self, client: TestClient) -> None:
+    def test_rollback_transaction_already_rollbacked(self, client: TestClient, user_ids: List[int]) -> None:
         """Test rolling back already rollbacked transaction returns 400."""
-        user_response = client.post("/users", json={"email": "doublerollback_api@example.com"})
-        user_id = user_response.json()["id"]
+        user_id = user_ids[0]
 
         tx_response = client.post(
             f"/transactions/users/{user_id}",
@@ -211,3 +237,34 @@ class TestTransactionsAPI:
 
         assert response.status_code == 400
         assert "already reversed" in response.json()["detail"].lower()
+
+    def test_create_transaction_evicts_cached_user(
+        self, client: TestClient, fake_redis: FakeRedis, user_ids: List[int]
+    ) -> None:
+        """Test that a deposit drops the cached user so the next read shows the new balance."""
+        user_id = user_ids[0]
+        client.get(f"/users/{user_id}")
+        assert user_cache_key(user_id) in fake_redis.store
+
+        client.post(
+            f"/transactions/users/{user_id}",
+            json={"currency": CurrencyEnumDB.USD, "amount": str(Decimal("100"))},
+        )
+
+        assert user_cache_key(user_id) not in fake_redis.store
+
+    def test_rollback_transaction_evicts_cached_user(
+        self, client: TestClient, fake_redis: FakeRedis, user_ids: List[int]
+    ) -> None:
+        """Test that a rollback drops the cached user so the next read shows the restored balance."""
+        user_id = user_ids[0]
+        tx_response = client.post(
+            f"/transactions/users/{user_id}",
+            json={"currency": CurrencyEnumDB.USD, "amount": str(Decimal("100"))},
+        )
+        client.get(f"/users/{user_id}")
+        assert user_cache_key(user_id) in fake_redis.store
+
+        client.patch(f"/transactions/users/{user_id}/transactions/{tx_response.json()['id']}/rollback")
+
+        assert user_cache_key(user_id) not in fake_redis.store
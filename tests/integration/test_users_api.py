@@ -1,8 +1,13 @@
 """Integration tests for Users API endpoints."""
 
+from typing import Callable, List
+
+import pytest
 from fastapi.testclient import TestClient
 
+from app.cache import user_cache_key
 from app.models.enums import UserStatusEnumDB
+from tests.fakes import FailingRedis, FakeRedis
 
 
 class TestUsersAPI:
@@ -18,75 +23,51 @@ class TestUsersAPI:
         assert data["status"] == UserStatusEnumDB.ACTIVE
         assert len(data["balances"]) > 0
 
-    def test_create_user_duplicate_email(self, client: TestClient) -> None:
+    def test_create_user_duplicate_email(self, client: TestClient, user_ids: List[int]) -> None:
         """Test creating user with duplicate email returns 409."""
-        email = "duplicate_api@example.com"
-        client.post("/users", json={"email": email})
+        email = client.get(f"/users/{user_ids[0]}").json()["email"]
 
         response = client.post("/users", json={"email": email})
 
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"].lower()
 
-    def test_create_user_invalid_email(self, client: TestClient) -> None:
-        """Test creating user with invalid email returns 422."""
-        response = client.post("/users", json={"email": "invalid-email"})
-
-        assert response.status_code == 422
-
-    def test_get_users_all(self, client: TestClient) -> None:
+    def test_get_users_all(self, client: TestClient, user_ids: List[int], count_queries: Callable) -> None:
         """Test getting all users."""
-        client.post("/users", json={"email": "user1@example.com"})
-        client.post("/users", json={"email": "user2@example.com"})
+        with count_queries() as queries:
+            response = client.get("/users")
 
-        response = client.get("/users")
+        assert len(queries) == 2
 
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 2
+        assert len(data) == len(user_ids)
 
-    def test_get_users_filter_by_id(self, client: TestClient) -> None:
-        """Test getting users filtered by ID."""
-        create_response = client.post("/users", json={"email": "filter_id@example.com"})
-        user_id = create_response.json()["id"]
+    @pytest.mark.parametrize("field, param", [("id", "user_id"), ("email", "email")])
+    def test_get_users_filter(self, client: TestClient, user_ids: List[int], field: str, param: str) -> None:
+        """Test getting users filtered by ID or email."""
+        user = client.get(f"/users/{user_ids[0]}").json()
 
-        response = client.get(f"/users?user_id={user_id}")
+        response = client.get("/users", params={param: user[field]})
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
-        assert data[0]["id"] == user_id
-
-    def test_get_users_filter_by_email(self, client: TestClient) -> None:
-        """Test getting users filtered by email."""
-        email = "filter_email@example.com"
-        client.post("/users", json={"email": email})
+        assert data[0][field] == user[field]
 
-        response = client.get(f"/users?email={email}")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["email"] == email
-
-    def test_get_users_filter_by_status(self, client: TestClient) -> None:
+    def test_get_users_filter_by_status(self, client: TestClient, blocked_user_id: int) -> None:
         """Test getting users filtered by status."""
-        create_response = client.post("/users", json={"email": "filter_status@example.com"})
-        user_id = create_response.json()["id"]
-
-        client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
-
         response = client.get(f"/users?user_status={UserStatusEnumDB.BLOCKED}")
 
         assert response.status_code == 200
         data = response.json()
+        assert [user["id"] for user in data] == [blocked_user_id]
         assert all(user["status"] == UserStatusEnumDB.BLOCKED for user in data)
 
-    def test_get_user_by_id_success(self, client: TestClient) -> None:
+    def test_get_user_by_id_success(self, client: TestClient, user_ids: List[int]) -> None:
         """Test getting user by ID."""
-        create_response = client.post("/users", json={"email": "get_by_id@example.com"})
-        user_id = create_response.json()["id"]
+        user_id = user_ids[0]
 
         response = client.get(f"/users/{user_id}")
 
@@ -95,51 +76,60 @@ class TestUsersAPI:
         assert data["id"] == user_id
         assert "balances" in data
 
-    def test_get_user_by_id_not_found(self, client: TestClient) -> None:
-        """Test getting non-existent user returns 404."""
-        response = client.get("/users/99999")
-
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_update_user_status_to_blocked(self, client: TestClient) -> None:
-        """Test updating user status to BLOCKED."""
-        create_response = client.post("/users", json={"email": "block_api@example.com"})
-        user_id = create_response.json()["id"]
-
-        response = client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == UserStatusEnumDB.BLOCKED
-
-    def test_update_user_status_to_active(self, client: TestClient) -> None:
-        """Test updating user status to ACTIVE."""
-        create_response = client.post("/users", json={"email": "activate_api@example.com"})
-        user_id = create_response.json()["id"]
-
-        client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
-
-        response = client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.ACTIVE})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == UserStatusEnumDB.ACTIVE
-
-    def test_update_user_status_already_blocked(self, client: TestClient) -> None:
-        """Test updating already blocked user returns 400."""
-        create_response = client.post("/users", json={"email": "alreadyblocked_api@example.com"})
-        user_id = create_response.json()["id"]
+    def test_user_status_transitions(self, client: TestClient, user_ids: List[int]) -> None:
+        """Test walking one user through ACTIVE -> BLOCKED -> ACTIVE, rejecting repeated transitions."""
+        user_id = user_ids[0]
+
+        for status, expected_code, expected in [
+            (UserStatusEnumDB.BLOCKED, 200, UserStatusEnumDB.BLOCKED),
+            (UserStatusEnumDB.BLOCKED, 400, "already blocked"),
+            (UserStatusEnumDB.ACTIVE, 200, UserStatusEnumDB.ACTIVE),
+            (UserStatusEnumDB.ACTIVE, 400, "already active"),
+        ]:
+            response = client.patch(f"/users/{user_id}", json={"status": status})
+
+            assert response.status_code == expected_code
+            if expected_code == 200:
+                assert response.json()["status"] == expected
+            else:
+                assert expected in response.json()["detail"].lower()
+
+    def test_get_user_by_id_served_from_cache(
+        self, client: TestClient, fake_redis: FakeRedis, user_ids: List[int], count_queries: Callable
+    ) -> None:
+        """Test that a second read of the same user is answered from the cache without touching the database."""
+        user_id = user_ids[0]
+        first = client.get(f"/users/{user_id}")
+
+        with count_queries() as queries:
+            second = client.get(f"/users/{user_id}")
+
+        assert len(queries) == 0
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert user_cache_key(user_id) in fake_redis.store
+
+    def test_update_user_status_evicts_cached_user(
+        self, client: TestClient, fake_redis: FakeRedis, user_ids: List[int]
+    ) -> None:
+        """Test that changing the status drops the cached user so the next read sees it."""
+        user_id = user_ids[0]
+        client.get(f"/users/{user_id}")
 
         client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
 
-        response = client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
+        assert user_cache_key(user_id) not in fake_redis.store
+        assert client.get(f"/users/{user_id}").json()["status"] == UserStatusEnumDB.BLOCKED
 
-        assert response.status_code == 400
-        assert "already blocked" in response.json()["detail"].lower()
+    def test_get_user_by_id_cache_failure_falls_back_to_database(
+        self, client: TestClient, failing_redis: FailingRedis, user_ids: List[int]
+    ) -> None:
+        """Test that reads and writes still succeed when every cache call fails."""
+        user_id = user_ids[0]
 
-    def test_update_user_status_not_found(self, client: TestClient) -> None:
-        """Test updating non-existent user returns 404."""
-        response = client.patch("/users/99999", json={"status": UserStatusEnumDB.BLOCKED})
+        response = client.get(f"/users/{user_id}")
+        patch_response = client.patch(f"/users/{user_id}", json={"status": UserStatusEnumDB.BLOCKED})
 
-        assert response.status_code == 404
+        assert response.status_code == 200
+        assert response.json()["id"] == user_id
+        assert patch_response.status_code == 200
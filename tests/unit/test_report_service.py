@@ -1,104 +1,83 @@
 """Unit tests for ReportService."""
 
 from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, List
 
-import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.models.enums import CurrencyEnumDB
-from app.models.schemas.transaction import RequestTransactionModel
-from app.models.schemas.user import UserCreateRequest
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
 from app.services.report_service import ReportService
-from app.services.transaction_service import TransactionService
-from app.services.user_service import UserService
 
 
 class TestReportService:
     """Test suite for ReportService."""
 
-    @pytest.mark.asyncio
-    async def test_generate_weekly_report_empty(self, db_session: AsyncSession) -> None:
+    async def test_generate_weekly_report_empty(self, services: SimpleNamespace) -> None:
         """Test generating weekly report with no transactions."""
-        service = ReportService(db_session)
-
-        result = await service.generate_weekly_report(weeks=1)
+        result = await services.report.generate_weekly_report(weeks=1)
 
         assert isinstance(result, list)
 
-    @pytest.mark.asyncio
-    async def test_generate_weekly_report_with_transactions(self, db_session: AsyncSession) -> None:
-        """Test generating weekly report with transactions."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
-        report_service = ReportService(db_session)
-
-        user = await user_service.create_user(UserCreateRequest(email="report@example.com"))
-
-        await transaction_service.create_transaction(
-            user.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100")),
+    async def test_generate_weekly_report_with_transactions(
+        self, services: SimpleNamespace, user_ids: List[int], count_queries: Callable
+    ) -> None:
+        """Test the weekly USD totals and counts computed in SQL, skipping drafts from posted totals."""
+        user_id = user_ids[0]
+
+        await services.tx.bulk_create(
+            [
+                (user_id, CurrencyEnumDB.USD, Decimal("100"), TransactionStatusEnumDB.POSTED),
+                (user_id, CurrencyEnumDB.EUR, Decimal("50"), TransactionStatusEnumDB.POSTED),
+                (user_id, CurrencyEnumDB.BTC, Decimal("0.12345678"), TransactionStatusEnumDB.POSTED),
+                (user_id, CurrencyEnumDB.EUR, Decimal("-20"), TransactionStatusEnumDB.POSTED),
+                (user_id, CurrencyEnumDB.USD, Decimal("1000"), TransactionStatusEnumDB.DRAFT),
+            ]
         )
-        await transaction_service.create_transaction(
-            user.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.EUR, amount=Decimal("50")),
-        )
-
-        result = await report_service.generate_weekly_report(weeks=1)
-
-        assert isinstance(result, list)
-        if len(result) > 0:
-            report = result[0]
-            assert "start_date" in report
-            assert "end_date" in report
-            assert "registered_users_count" in report
-            assert "total_transactions_count" in report
-
-    @pytest.mark.asyncio
-    async def test_convert_to_usd(self, db_session: AsyncSession) -> None:
-        """Test currency conversion to USD."""
-        service = ReportService(db_session)
-
-        usd_amount = service._convert_to_usd(Decimal("100"), "USD")
-        assert usd_amount == Decimal("100")
-
-        eur_amount = service._convert_to_usd(Decimal("100"), "EUR")
-        assert eur_amount > Decimal("0")
 
-        unknown_amount = service._convert_to_usd(Decimal("100"), "UNKNOWN")
-        assert unknown_amount == Decimal("100")
-
-    @pytest.mark.asyncio
-    async def test_has_activity(self, db_session: AsyncSession) -> None:
+        with count_queries() as queries:
+            result = await services.report.generate_weekly_report(weeks=1)
+
+        assert len(queries) == 2
+        assert len(result) == 1
+        report = result[0]
+        assert report["registered_users_count"] == len(user_ids)
+        assert report["users_with_deposits_count"] == 1
+        assert report["users_with_posted_deposits_count"] == 1
+        assert report["users_with_posted_withdrawals_count"] == 1
+        assert report["total_transactions_count"] == 5
+        assert report["posted_transactions_count"] == 4
+        assert report["total_deposits_usd"] == Decimal("12492.38800000")
+        assert report["total_withdrawals_usd"] == Decimal("18.68400000")
+
+    def test_has_activity(self) -> None:
         """Test checking if report has activity."""
-        service = ReportService(db_session)
-
         empty_report = {
             "registered_users_count": 0,
             "users_with_deposits_count": 0,
             "total_transactions_count": 0,
         }
-        assert service._has_activity(empty_report) is False
+        assert ReportService._has_activity(empty_report) is False
 
         report_with_users = {
             "registered_users_count": 1,
             "users_with_deposits_count": 0,
             "total_transactions_count": 0,
         }
-        assert service._has_activity(report_with_users) is True
+        assert ReportService._has_activity(report_with_users) is True
 
         report_with_transactions = {
             "registered_users_count": 0,
             "users_with_deposits_count": 0,
             "total_transactions_count": 1,
         }
-        assert service._has_activity(report_with_transactions) is True
-
-    @pytest.mark.asyncio
-    async def test_generate_weekly_report_multiple_weeks(self, db_session: AsyncSession) -> None:
-        """Test generating report for multiple weeks."""
-        service = ReportService(db_session)
+        assert ReportService._has_activity(report_with_transactions) is True
 
-        result = await service.generate_weekly_report(weeks=4)
+    async def test_generate_weekly_report_multiple_weeks(
+        self, services: SimpleNamespace, count_queries: Callable
+    ) -> None:
+        """Test generating report for multiple weeks with the same number of queries as for one."""
+        with count_queries() as queries:
+            result = await services.report.generate_weekly_report(weeks=4)
 
+        assert len(queries) == 2
         assert isinstance(result, list)
         assert len(result) <= 4
@@ -1,156 +1,161 @@
 """Unit tests for TransactionService."""
 
 from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.exceptions import NegativeBalanceException, TransactionNotFound, UserBlockedException, UserNotExistsException
-from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB, UserStatusEnumDB
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.exceptions import (
+    NegativeBalanceException,
+    TransactionAlreadyRollbackedException,
+    TransactionNotFound,
+    UserBlockedException,
+    UserNotExistsException,
+)
+from app.models.enums import CurrencyEnumDB, TransactionStatusEnumDB
 from app.models.schemas.transaction import RequestTransactionModel
-from app.models.schemas.user import UserCreateRequest, UserUpdateRequest
 from app.services.transaction_service import TransactionService
-from app.services.user_service import UserService
+
+USD_100_DEPOSIT = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100"))
 
 
 class TestTransactionService:
     """Test suite for TransactionService."""
 
-    @pytest.mark.asyncio
-    async def test_create_deposit_transaction_success(self, db_session: AsyncSession) -> None:
+    async def test_create_deposit_transaction_success(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test successful deposit transaction creation."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
-
-        user = await user_service.create_user(UserCreateRequest(email="deposit@example.com"))
+        user_id = user_ids[0]
         transaction_data = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100.50"))
 
-        result = await transaction_service.create_transaction(user.id, transaction_data)
+        result = await services.tx.create_transaction(user_id, transaction_data)
 
         assert result.id is not None
-        assert result.user_id == user.id
+        assert result.user_id == user_id
         assert result.currency == CurrencyEnumDB.USD
         assert result.amount == Decimal("100.50")
         assert result.status == TransactionStatusEnumDB.POSTED
 
-    @pytest.mark.asyncio
-    async def test_create_withdrawal_transaction_success(self, db_session: AsyncSession) -> None:
+    async def test_create_withdrawal_transaction_success(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test successful withdrawal transaction creation."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
+        user_id = user_ids[0]
 
-        user = await user_service.create_user(UserCreateRequest(email="withdraw@example.com"))
-
-        await transaction_service.create_transaction(
-            user.id,
+        await services.tx.create_transaction(
+            user_id,
             RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("200")),
         )
 
         transaction_data = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("-50.25"))
-        result = await transaction_service.create_transaction(user.id, transaction_data)
+        result = await services.tx.create_transaction(user_id, transaction_data)
 
         assert result.amount == Decimal("-50.25")
         assert result.status == TransactionStatusEnumDB.POSTED
 
-    @pytest.mark.asyncio
-    async def test_create_transaction_user_not_found(self, db_session: AsyncSession) -> None:
+    async def test_create_transaction_user_not_found(self, services: SimpleNamespace) -> None:
         """Test creating transaction for non-existent user raises exception."""
-        transaction_service = TransactionService(db_session)
-        transaction_data = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100"))
-
         with pytest.raises(UserNotExistsException):
-            await transaction_service.create_transaction(99999, transaction_data)
+            await services.tx.create_transaction(99999, USD_100_DEPOSIT)
 
-    @pytest.mark.asyncio
-    async def test_create_transaction_user_blocked(self, db_session: AsyncSession) -> None:
+    async def test_create_transaction_user_blocked(self, services: SimpleNamespace, blocked_user_id: int) -> None:
         """Test creating transaction for blocked user raises exception."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
+        with pytest.raises(UserBlockedException, match=r"(?i)blocked"):
+            await services.tx.create_transaction(blocked_user_id, USD_100_DEPOSIT)
 
-        user = await user_service.create_user(UserCreateRequest(email="blocked@example.com"))
-        await user_service.update_user_status(user.id, UserUpdateRequest(status=UserStatusEnumDB.BLOCKED))
-
-        transaction_data = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100"))
-
-        with pytest.raises(UserBlockedException) as exc_info:
-            await transaction_service.create_transaction(user.id, transaction_data)
-
-        assert "blocked" in exc_info.value.detail.lower()
-
-    @pytest.mark.asyncio
-    async def test_create_transaction_negative_balance(self, db_session: AsyncSession) -> None:
+    async def test_create_transaction_negative_balance(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test creating transaction that would result in negative balance raises exception."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
-
-        user = await user_service.create_user(UserCreateRequest(email="negative@example.com"))
+        user_id = user_ids[0]
         transaction_data = RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("-100"))
 
-        with pytest.raises(NegativeBalanceException) as exc_info:
-            await transaction_service.create_transaction(user.id, transaction_data)
+        with pytest.raises(NegativeBalanceException, match=r"(?i)insufficient|balance"):
+            await services.tx.create_transaction(user_id, transaction_data)
 
-        assert "insufficient" in exc_info.value.detail.lower() or "balance" in exc_info.value.detail.lower()
-
-    @pytest.mark.asyncio
-    async def test_get_transactions_all(self, db_session: AsyncSession) -> None:
+    async def test_get_transactions_all(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test getting all transactions."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
-
-        user1 = await user_service.create_user(UserCreateRequest(email="user1@example.com"))
-        user2 = await user_service.create_user(UserCreateRequest(email="user2@example.com"))
+        user1_id, user2_id = user_ids[:2]
 
-        await transaction_service.create_transaction(
-            user1.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100")),
-        )
-        await transaction_service.create_transaction(
-            user2.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.EUR, amount=Decimal("50")),
+        await services.tx.bulk_create(
+            [
+                (user1_id, CurrencyEnumDB.USD, Decimal("100"), TransactionStatusEnumDB.POSTED),
+                (user2_id, CurrencyEnumDB.EUR, Decimal("50"), TransactionStatusEnumDB.POSTED),
+            ]
         )
 
-        results = await transaction_service.get_transactions()
+        results = await services.tx.get_transactions()
 
-        assert len(results) >= 2
+        assert len(results) == 2
 
-    @pytest.mark.asyncio
-    async def test_get_transactions_by_user(self, db_session: AsyncSession) -> None:
+    async def test_get_transactions_by_user(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test getting transactions filtered by user."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
+        user1_id, user2_id = user_ids[:2]
 
-        user1 = await user_service.create_user(UserCreateRequest(email="filter1@example.com"))
-        user2 = await user_service.create_user(UserCreateRequest(email="filter2@example.com"))
-
-        await transaction_service.create_transaction(
-            user1.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.USD, amount=Decimal("100")),
-        )
-        await transaction_service.create_transaction(
-            user2.id,
-            RequestTransactionModel(currency=CurrencyEnumDB.EUR, amount=Decimal("50")),
+        await services.tx.bulk_create(
+            [
+                (user1_id, CurrencyEnumDB.USD, Decimal("100"), TransactionStatusEnumDB.POSTED),
+                (user2_id, CurrencyEnumDB.EUR, Decimal("50"), TransactionStatusEnumDB.POSTED),
+            ]
         )
 
-        results = await transaction_service.get_transactions(user_id=user1.id)
+        results = await services.tx.get_transactions(user_id=user1_id)
 
         assert len(results) == 1
-        assert results[0].user_id == user1.id
+        assert results[0].user_id == user1_id
 
-    @pytest.mark.asyncio
-    async def test_rollback_transaction_user_not_found(self, db_session: AsyncSession) -> None:
-        """Test rolling back transaction for non-existent user raises exception."""
-        transaction_service = TransactionService(db_session)
+    async def test_bulk_create_transactions(self, services: SimpleNamespace, user_ids: List[int]) -> None:
+        """Test bulk importing raw transaction records."""
+        user_id = user_ids[0]
+        records = [
+            (user_id, CurrencyEnumDB.USD, Decimal("10"), TransactionStatusEnumDB.POSTED),
+            (user_id, CurrencyEnumDB.EUR, Decimal("-5"), TransactionStatusEnumDB.DRAFT),
+            (user_id, CurrencyEnumDB.BTC, Decimal("0.5"), TransactionStatusEnumDB.REVERSED),
+        ]
+
+        inserted = await services.tx.bulk_create(records)
+        results = await services.tx.get_transactions(user_id=user_id)
+
+        assert inserted == 3
+        assert len(results) == 3
+        assert {r.currency for r in results} == {CurrencyEnumDB.USD, CurrencyEnumDB.EUR, CurrencyEnumDB.BTC}
 
+    async def test_rollback_transaction_user_not_found(self, services: SimpleNamespace) -> None:
+        """Test rolling back transaction for non-existent user raises exception."""
         with pytest.raises(UserNotExistsException):
-            await transaction_service.rollback_transaction(99999, 1)
+            await services.tx.rollback_transaction(99999, 1)
 
-    @pytest.mark.asyncio
-    async def test_rollback_transaction_not_found(self, db_session: AsyncSession) -> None:
+    async def test_rollback_transaction_not_found(self, services: SimpleNamespace, user_ids: List[int]) -> None:
         """Test rolling back non-existent transaction raises exception."""
-        user_service = UserService(db_session)
-        transaction_service = TransactionService(db_session)
-
-        user = await user_service.create_user(UserCreateRequest(email="notfound@example.com"))
+        user_id = user_ids[0]
 
         with pytest.raises(TransactionNotFound):
-            await transaction_service.rollback_transaction(user.id, 99999)
+            await services.tx.rollback_transaction(user_id, 99999)
+
+    async def test_rollback_transaction_concurrent_reversal_rejected(
+        self,
+        services: SimpleNamespace,
+        session_maker: async_sessionmaker,
+        user_ids: List[int],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a rollback acting on a context read before a concurrent rollback does not reverse twice."""
+        user_id = user_ids[0]
+        await services.tx.create_transaction(user_id, USD_100_DEPOSIT)
+        transaction = await services.tx.create_transaction(user_id, USD_100_DEPOSIT)
+
+        async with session_maker() as session:
+            concurrent = TransactionService(session)
+            stale_context = await concurrent.transaction_repository.get_rollback_context(user_id, transaction.id)
+            await session.commit()
+
+            await services.tx.rollback_transaction(user_id, transaction.id)
+
+            async def _stale_context(*args) -> Row:
+                return stale_context
+
+            monkeypatch.setattr(concurrent.transaction_repository, "get_rollback_context", _stale_context)
+            with pytest.raises(TransactionAlreadyRollbackedException):
+                await concurrent.rollback_transaction(user_id, transaction.id)
+
+        user = await services.user.get_user_by_id(user_id)
+        usd_balance = next(b for b in user.balances if b.currency == CurrencyEnumDB.USD)
+        assert usd_balance.amount == Decimal("100")
@@ -1,6 +1,10 @@
 """Unit tests for UserService."""
 
+from contextlib import nullcontext
+from typing import List, Optional, Type
+
 import pytest
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import (
@@ -17,7 +21,6 @@ from app.services.user_service import UserService
 class TestUserService:
     """Test suite for UserService."""
 
-    @pytest.mark.asyncio
     async def test_create_user_success(self, db_session: AsyncSession) -> None:
         """Test successful user creation with balances."""
         service = UserService(db_session)
@@ -30,7 +33,6 @@ class TestUserService:
         assert result.status == UserStatusEnumDB.ACTIVE
         assert len(result.balances) == len(CurrencyEnumDB)
 
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_email(self, db_session: AsyncSession) -> None:
         """Test user creation with duplicate email raises exception."""
         service = UserService(db_session)
@@ -38,12 +40,14 @@ class TestUserService:
 
         await service.create_user(user_data)
 
-        with pytest.raises(UserAlreadyExistsException) as exc_info:
+        with pytest.raises(UserAlreadyExistsException, match=r"(?i)already exists"):
             await service.create_user(user_data)
 
-        assert "already exists" in exc_info.value.detail.lower()
+    def test_create_user_invalid_email(self) -> None:
+        """Test that an invalid email is rejected before reaching the service."""
+        with pytest.raises(ValidationError):
+            UserCreateRequest(email="invalid-email")
 
-    @pytest.mark.asyncio
     async def test_get_user_by_id_success(self, db_session: AsyncSession) -> None:
         """Test getting user by ID."""
         service = UserService(db_session)
@@ -56,72 +60,47 @@ class TestUserService:
         assert result.email == "get@example.com"
         assert len(result.balances) == len(CurrencyEnumDB)
 
-    @pytest.mark.asyncio
     async def test_get_user_by_id_not_found(self, db_session: AsyncSession) -> None:
         """Test getting non-existent user raises exception."""
         service = UserService(db_session)
 
-        with pytest.raises(UserNotExistsException) as exc_info:
+        with pytest.raises(UserNotExistsException, match=r"(?i)not found"):
             await service.get_user_by_id(99999)
 
-        assert "not found" in exc_info.value.detail.lower()
-
-    @pytest.mark.asyncio
-    async def test_update_user_status_to_blocked(self, db_session: AsyncSession) -> None:
-        """Test updating user status to BLOCKED."""
+    @pytest.mark.parametrize(
+        "initial, target, expected_exc",
+        [
+            (UserStatusEnumDB.ACTIVE, UserStatusEnumDB.BLOCKED, None),
+            (UserStatusEnumDB.BLOCKED, UserStatusEnumDB.ACTIVE, None),
+            (UserStatusEnumDB.BLOCKED, UserStatusEnumDB.BLOCKED, UserAlreadyBlockedException),
+            (UserStatusEnumDB.ACTIVE, UserStatusEnumDB.ACTIVE, UserAlreadyActiveException),
+        ],
+    )
+    async def test_update_user_status(
+        self,
+        db_session: AsyncSession,
+        user_ids: List[int],
+        initial: UserStatusEnumDB,
+        target: UserStatusEnumDB,
+        expected_exc: Optional[Type[Exception]],
+    ) -> None:
+        """Test each status transition, including the no-op ones that raise."""
         service = UserService(db_session)
-        user_data = UserCreateRequest(email="block@example.com")
-
-        created_user = await service.create_user(user_data)
-        update_data = UserUpdateRequest(status=UserStatusEnumDB.BLOCKED)
-
-        result = await service.update_user_status(created_user.id, update_data)
-
-        assert result.status == UserStatusEnumDB.BLOCKED
-        assert result.id == created_user.id
-
-    @pytest.mark.asyncio
-    async def test_update_user_status_to_active(self, db_session: AsyncSession) -> None:
-        """Test updating user status from BLOCKED to ACTIVE."""
-        service = UserService(db_session)
-        user_data = UserCreateRequest(email="activate@example.com")
-
-        created_user = await service.create_user(user_data)
-
-        await service.update_user_status(created_user.id, UserUpdateRequest(status=UserStatusEnumDB.BLOCKED))
+        user_id = user_ids[0]
 
-        result = await service.update_user_status(created_user.id, UserUpdateRequest(status=UserStatusEnumDB.ACTIVE))
-
-        assert result.status == UserStatusEnumDB.ACTIVE
-
-    @pytest.mark.asyncio
-    async def test_update_user_status_already_blocked(self, db_session: AsyncSession) -> None:
-        """Test updating already blocked user raises exception."""
-        service = UserService(db_session)
-        user_data = UserCreateRequest(email="alreadyblocked@example.com")
-
-        created_user = await service.create_user(user_data)
-        await service.update_user_status(created_user.id, UserUpdateRequest(status=UserStatusEnumDB.BLOCKED))
-
-        with pytest.raises(UserAlreadyBlockedException) as exc_info:
-            await service.update_user_status(created_user.id, UserUpdateRequest(status=UserStatusEnumDB.BLOCKED))
-
-        assert "already blocked" in exc_info.value.detail.lower()
-
-    @pytest.mark.asyncio
-    async def test_update_user_status_already_active(self, db_session: AsyncSession) -> None:
-        """Test updating already active user raises exception."""
-        service = UserService(db_session)
-        user_data = UserCreateRequest(email="alreadyactive@example.com")
-
-        created_user = await service.create_user(user_data)
+        if initial != UserStatusEnumDB.ACTIVE:
+            await service.update_user_status(user_id, UserUpdateRequest(status=initial))
 
-        with pytest.raises(UserAlreadyActiveException) as exc_info:
-            await service.update_user_status(created_user.id, UserUpdateRequest(status=UserStatusEnumDB.ACTIVE))
+        expectation = (
+            pytest.raises(expected_exc, match=rf"(?i)already {target.value}") if expected_exc else nullcontext()
+        )
+        with expectation:
+            result = await service.update_user_status(user_id, UserUpdateRequest(status=target))
 
-        assert "already active" in exc_info.value.detail.lower()
+        if expected_exc is None:
+            assert result.id == user_id
+            assert result.status == target
 
-    @pytest.mark.asyncio
     async def test_update_user_status_not_found(self, db_session: AsyncSession) -> None:
         """Test updating non-existent user raises exception."""
         service = UserService(db_session)